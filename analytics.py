@@ -0,0 +1,204 @@
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+# --- Lokasi Dataset ---
+DATA_FILE = "Social Media Engagement Dataset.csv"
+
+# --- Fitur & Target Model ---
+FEATURES = ['day_of_week', 'language', 'platform', 'keyword_model', 'hashtag_model', 'campaign_name']
+TARGETS_REG = ['likes_count', 'shares_count', 'comments_count', 'toxicity_score', 'impressions', 'engagement_rate']
+TARGET_CLF = 'emotion_type'
+
+# --- Konfigurasi Model ---
+# Parameter estimator per model ('backend' memilih jenis forest, sisanya diteruskan ke
+# estimator). File konfigurasi (jika ada, misal hasil tune.py) menggantikan nilai bawaan ini.
+# Backend dicatat sebagai nama kelas sklearn.ensemble; sklearn baru diimpor saat model dibuat.
+MODEL_CONFIG_FILE = os.environ.get("ENGAGEMENT_MODEL_CONFIG", "model_config.json")
+DEFAULT_MODEL_CONFIG = {
+    'regressor': {'n_estimators': 100},
+    'classifier': {'n_estimators': 100},
+}
+# Jumlah thread estimator di model yang dipakai app (fit & predict); juga dipakai saat mengukur latensi
+MODEL_N_JOBS = -1
+BACKENDS = {
+    'random_forest': ('RandomForestRegressor', 'RandomForestClassifier'),
+    'extra_trees': ('ExtraTreesRegressor', 'ExtraTreesClassifier'),
+}
+
+
+# --- Fungsi Load Data ---
+def load_data(path=DATA_FILE):
+    """
+    Memuat dan memproses dataset dari file CSV.
+    """
+    df = pd.read_csv(path)
+
+    # --- PERBAIKAN PENTING: Normalisasi Rate ---
+    df['engagement_rate'] = df['engagement_rate'].apply(lambda x: x / 100 if x > 2 else x)
+    df['toxicity_score'] = df['toxicity_score'].apply(lambda x: x / 100 if x > 2 else x)
+    # --- AKHIR PERBAIKAN ---
+
+    # 'Explode' hashtags dan keywords
+    df_hashtags = df.assign(hashtag=df['hashtags'].str.split(',')).explode('hashtag')
+    df_hashtags['hashtag'] = df_hashtags['hashtag'].str.strip().str.lower()
+
+    df_keywords = df.assign(keyword=df['keywords'].str.split(',')).explode('keyword')
+    df_keywords['keyword'] = df_keywords['keyword'].str.strip().str.lower()
+
+    return df, df_hashtags, df_keywords
+
+
+# --- Fungsi Pra-pemrosesan Model ---
+def prepare_model_frame(_df):
+    """
+    Menambahkan kolom fitur model (keyword & hashtag utama) lalu membuang baris yang tidak lengkap.
+    """
+    _df['keyword_model'] = _df['keywords'].str.split(',').str[0].str.strip().str.lower()
+    _df['hashtag_model'] = _df['hashtags'].str.split(',').str[0].str.strip().str.lower()
+
+    return _df.dropna(subset=FEATURES + TARGETS_REG + [TARGET_CLF])
+
+
+# --- Fungsi Konfigurasi Model ---
+def load_model_config(path=MODEL_CONFIG_FILE):
+    """
+    Membaca konfigurasi model dari file JSON, atau konfigurasi bawaan jika file tidak ada.
+    """
+    if path and os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    return DEFAULT_MODEL_CONFIG
+
+
+def config_hash(config):
+    """
+    Hash pendek konfigurasi model, dipakai sebagai bagian dari versi model & kunci cache.
+    """
+    return hashlib.sha256(json.dumps(config, sort_keys=True).encode('utf-8')).hexdigest()[:12]
+
+
+def make_preprocessor():
+    """
+    One-hot encoder untuk keenam fitur kategorikal.
+    """
+    from sklearn.compose import ColumnTransformer
+    from sklearn.preprocessing import OneHotEncoder
+
+    return ColumnTransformer(
+        transformers=[
+            ('cat', OneHotEncoder(handle_unknown='ignore', sparse_output=False), FEATURES)
+        ],
+        remainder='passthrough'
+    )
+
+
+def make_estimator(kind, params, n_jobs=MODEL_N_JOBS):
+    """
+    Membuat estimator 'regressor' atau 'classifier' dari parameter konfigurasi.
+    """
+    from sklearn import ensemble
+
+    params = dict(params)
+    regressor_name, classifier_name = BACKENDS[params.pop('backend', 'random_forest')]
+    estimator_class = getattr(ensemble, regressor_name if kind == 'regressor' else classifier_name)
+    return estimator_class(random_state=42, n_jobs=n_jobs, **params)
+
+
+# --- Fungsi Training Model ---
+def train_models(_df, config=None):
+    """
+    Melatih model Regresi dan Klasifikasi.
+    """
+    from sklearn.pipeline import Pipeline
+
+    config = config or load_model_config()
+
+    # Pra-pemrosesan data untuk model
+    _df_cleaned = prepare_model_frame(_df)
+
+    X = _df_cleaned[FEATURES]
+    y_reg = _df_cleaned[TARGETS_REG]
+    y_clf = _df_cleaned[TARGET_CLF]
+
+    preprocessor = make_preprocessor()
+
+    # Model Regresi
+    pipeline_reg = Pipeline(steps=[
+        ('preprocessor', preprocessor),
+        ('regressor', make_estimator('regressor', config['regressor']))
+    ])
+    pipeline_reg.fit(X, y_reg)
+
+    # Model Klasifikasi
+    pipeline_clf = Pipeline(steps=[
+        ('preprocessor', preprocessor),
+        ('classifier', make_estimator('classifier', config['classifier']))
+    ])
+    pipeline_clf.fit(X, y_clf)
+
+    unique_values = {col: _df_cleaned[col].unique().tolist() for col in FEATURES}
+
+    return pipeline_reg, pipeline_clf, unique_values
+
+
+def build_model_artifact(_df, config=None):
+    """
+    Melatih model untuk satu partisi dan membungkusnya sebagai artefak yang bisa disimpan ke disk.
+    """
+    config = config or load_model_config()
+    pipeline_reg, pipeline_clf, unique_values = train_models(_df.copy(), config)
+    return {'pipeline_reg': pipeline_reg, 'pipeline_clf': pipeline_clf, 'unique_values': unique_values,
+            'config': config}
+
+
+# --- Fungsi Metrik Saran ---
+def golden_combos(_df, by=None):
+    """
+    Kombinasi platform + hari + bahasa dengan rata-rata engagement tertinggi ("kombinasi emas"),
+    untuk seluruh data atau per nilai kolom `by` (semua grup sekaligus, satu baris per grup).
+    Mengembalikan Series rata-rata engagement berindeks ([grup,] platform, hari, bahasa).
+    """
+    keys = ([by] if by else []) + ['platform', 'day_of_week', 'language']
+    combos = _df.groupby(keys)['engagement_rate'].mean().dropna()
+    if by:
+        return combos.loc[combos.groupby(level=0).idxmax()]
+    return combos.nlargest(1)
+
+
+def get_advanced_metrics(_df, _df_keywords):
+    """
+    Menghitung metrik lanjutan untuk saran yang lebih cerdas.
+    """
+    metrics = {}
+
+    # 1. Platform Metrics (rata-rata per platform)
+    metrics['platform'] = _df.groupby('platform').agg(
+        avg_engagement=('engagement_rate', 'mean'),
+        avg_toxicity=('toxicity_score', 'mean'),
+        top_day=('day_of_week', lambda x: x.value_counts().idxmax())
+    ).to_dict('index')
+
+    # 2. Day Metrics (rata-rata per platform, per hari)
+    metrics['day'] = _df.groupby(['platform', 'day_of_week'])['engagement_rate'].mean().to_dict()
+
+    # 3. Language Metrics (rata-rata per platform, per bahasa)
+    metrics['lang'] = _df.groupby(['platform', 'language'])['engagement_rate'].mean().to_dict()
+
+    # 4. Keyword Metrics (rata-rata global per keyword)
+    keyword_df_cleaned = _df_keywords[_df_keywords['keyword'].notna()]
+    # Perbaikan dari error sebelumnya: langsung gunakan df yang sudah di-explode
+    metrics['keyword'] = keyword_df_cleaned.groupby('keyword')['engagement_rate'].mean().to_dict()
+
+    # 5. Golden Combo (Kombinasi Emas)
+    try:
+        golden_combo_df = golden_combos(_df)
+        if not golden_combo_df.empty:
+            metrics['golden_combo'] = golden_combo_df.index[0]
+            metrics['golden_avg'] = golden_combo_df.values[0]
+    except Exception:
+        pass # Abaikan jika gagal (misal: data terlalu sedikit)
+
+    return metrics
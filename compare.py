@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+
+# --- Konfigurasi Bootstrap ---
+BOOTSTRAP_RESAMPLES = 2000
+CONFIDENCE_LEVEL = 0.95
+COMPARE_METRICS = ['engagement_rate', 'likes_count', 'shares_count']
+
+# Batas elemen matriks resample per potongan (~64 MB float64), agar memori tetap terkendali
+CHUNK_ELEMENTS = 8_000_000
+
+
+def bootstrap_group_means(codes, values, n_resamples=BOOTSTRAP_RESAMPLES,
+                          confidence=CONFIDENCE_LEVEL, random_state=42):
+    """
+    Bootstrap rata-rata per grup untuk semua grup dan metrik sekaligus.
+
+    `codes` adalah kode grup 0..G-1 (setiap grup minimal punya satu baris) dan `values`
+    matriks (n_baris, n_metrik). Baris diurutkan per grup, lalu setiap resample untuk
+    semua grup dibuat sebagai satu matriks indeks (resample x baris); jumlah per grup
+    dihitung dengan np.add.reduceat. Tidak ada loop Python per grup atau per resample,
+    hanya per potongan resample agar memori terbatas.
+
+    Mengembalikan (rata-rata, batas bawah, batas atas), masing-masing (G, n_metrik).
+    """
+    codes = np.asarray(codes)
+    values = np.asarray(values, dtype=float)
+    order = np.argsort(codes, kind='stable')
+    codes, values = codes[order], values[order]
+
+    sizes = np.bincount(codes)
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    row_start = starts[codes]
+    row_size = sizes[codes]
+
+    n_rows, n_metrics = values.shape
+    chunk = max(1, CHUNK_ELEMENTS // max(1, n_rows * n_metrics))
+    rng = np.random.default_rng(random_state)
+    boot_means = np.empty((n_resamples, len(sizes), n_metrics))
+
+    for first in range(0, n_resamples, chunk):
+        n_chunk = min(chunk, n_resamples - first)
+        # Setiap baris diganti dengan baris acak dari grupnya sendiri
+        idx = row_start + (rng.random((n_chunk, n_rows)) * row_size).astype(np.intp)
+        sums = np.add.reduceat(values[idx], starts, axis=1)
+        boot_means[first:first + n_chunk] = sums / sizes[None, :, None]
+
+    alpha = (1 - confidence) / 2
+    lower, upper = np.quantile(boot_means, [alpha, 1 - alpha], axis=0)
+    means = np.add.reduceat(values, starts, axis=0) / sizes[:, None]
+    return means, lower, upper
+
+
+def compare_groups(_df, by, selected, metrics=COMPARE_METRICS, n_resamples=BOOTSTRAP_RESAMPLES,
+                   confidence=CONFIDENCE_LEVEL):
+    """
+    Membandingkan rata-rata metrik antar nilai kolom `by` (campaign/brand/produk) yang dipilih,
+    lengkap dengan interval kepercayaan bootstrap.
+    """
+    subset = _df[_df[by].isin(selected)].dropna(subset=metrics)
+    codes, groups = pd.factorize(subset[by])
+    if len(groups) == 0:
+        return pd.DataFrame(columns=['group', 'metric', 'mean', 'lower', 'upper', 'n'])
+
+    means, lower, upper = bootstrap_group_means(codes, subset[metrics].to_numpy(), n_resamples, confidence)
+    sizes = np.bincount(codes)
+
+    rows = []
+    for g, group in enumerate(groups):
+        for m, metric in enumerate(metrics):
+            rows.append({
+                'group': group, 'metric': metric, 'mean': means[g, m],
+                'lower': lower[g, m], 'upper': upper[g, m], 'n': int(sizes[g])
+            })
+    return pd.DataFrame(rows)
@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+# --- Konfigurasi Co-occurrence ---
+COOCCURRENCE_METRIC = 'engagement_rate'
+MIN_PAIR_SUPPORT = 5  # Pasangan yang muncul di kurang dari ini postingan diabaikan (lift tidak stabil)
+TOP_K = 10
+LIFT_MEASURES = ['lift', 'engagement_lift']
+
+
+def post_tag_matrix(_df_exploded, column):
+    """
+    Matriks biner sparse (postingan x tag) dari frame hasil explode (satu baris per postingan-tag).
+    Indeks frame adalah indeks postingan asli. Mengembalikan (X, indeks postingan, daftar tag).
+    """
+    pairs = _df_exploded[column].dropna()
+    pairs = pairs[pairs != '']
+    post_codes, posts = pd.factorize(pairs.index)
+    tag_codes, tags = pd.factorize(pairs.to_numpy())
+    X = sparse.csr_matrix((np.ones(len(pairs)), (post_codes, tag_codes)), shape=(len(posts), len(tags)))
+    # Tag yang sama dua kali di satu postingan tetap dihitung sekali
+    X.data[:] = 1.0
+    return X, posts, tags
+
+
+def build_cooccurrence(_df, _df_exploded, column, metric=COOCCURRENCE_METRIC):
+    """
+    Jumlah postingan dan jumlah `metric` untuk setiap pasangan tag, dihitung dengan perkalian
+    matriks sparse: counts = Xᵀ·X dan sums = Xᵀ·diag(w)·X, dengan w nilai metrik per postingan.
+    Diagonal kedua matriks berisi angka per tag. Tidak ada merge berpasangan antar frame,
+    jadi biayanya sebanding dengan jumlah pasangan yang benar-benar muncul.
+    """
+    X, posts, tags = post_tag_matrix(_df_exploded, column)
+    weights = _df[metric].reindex(posts).to_numpy(dtype=float)
+    valid = ~np.isnan(weights)
+    X, weights = X[valid], weights[valid]
+
+    counts = (X.T @ X).tocsr()
+    sums = (X.T @ sparse.diags(weights) @ X).tocsr()
+    return {
+        'tags': np.asarray(tags),
+        'counts': counts,
+        'sums': sums,
+        'n_posts': X.shape[0],
+        'overall_mean': float(weights.mean()) if len(weights) else float('nan'),
+    }
+
+
+def top_pairs(cooc, k=TOP_K, by='engagement_lift', min_support=MIN_PAIR_SUPPORT, tag=None):
+    """
+    k pasangan tag teratas menurut `by`:
+      - 'lift'            : seberapa sering pasangan muncul bersama dibanding jika independen,
+                            P(a,b) / (P(a)·P(b)).
+      - 'engagement_lift' : rata-rata metrik pasangan dibagi rata-rata terbaik kedua tag jika
+                            berdiri sendiri (> 1 berarti kombinasi mengungguli masing-masing tag).
+    Jika `tag` diberikan, hanya pasangan yang mengandung tag tersebut.
+    """
+    counts, sums, tags = cooc['counts'], cooc['sums'], cooc['tags']
+    tag_counts = counts.diagonal()
+    tag_means = np.divide(sums.diagonal(), tag_counts, out=np.zeros(len(tags)), where=tag_counts > 0)
+
+    # Segitiga atas saja: setiap pasangan (a, b) satu kali, tanpa diagonal
+    upper = sparse.triu(counts, k=1).tocoo()
+    rows, cols, pair_counts = upper.row, upper.col, upper.data
+    keep = pair_counts >= min_support
+    if tag is not None:
+        tag_index = np.flatnonzero(tags == tag)
+        keep &= np.isin(rows, tag_index) | np.isin(cols, tag_index)
+    rows, cols, pair_counts = rows[keep], cols[keep], pair_counts[keep]
+
+    pair_sums = np.asarray(sums[rows, cols], dtype=float).ravel() if len(rows) else np.zeros(0)
+    pair_means = pair_sums / pair_counts
+    best_single = np.maximum(tag_means[rows], tag_means[cols])
+    measures = {
+        'lift': pair_counts * cooc['n_posts'] / (tag_counts[rows] * tag_counts[cols]),
+        'engagement_lift': np.divide(pair_means, best_single, out=np.full(len(rows), np.nan), where=best_single > 0),
+    }
+
+    # Hanya k teratas yang diurutkan penuh
+    score = np.nan_to_num(measures[by], nan=-np.inf)
+    if len(score) > k:
+        top = np.argpartition(-score, k)[:k]
+    else:
+        top = np.arange(len(score))
+    top = top[np.argsort(-score[top], kind='stable')]
+
+    return pd.DataFrame({
+        'tag_a': tags[rows[top]],
+        'tag_b': tags[cols[top]],
+        'posts': pair_counts[top].astype(int),
+        'pair_mean': pair_means[top],
+        'mean_a': tag_means[rows[top]],
+        'mean_b': tag_means[cols[top]],
+        'lift': measures['lift'][top],
+        'engagement_lift': measures['engagement_lift'][top],
+    })
@@ -0,0 +1,92 @@
+import hashlib
+import os
+
+import pandas as pd
+
+from analytics import load_data, load_model_config, config_hash, DATA_FILE
+
+# --- Lokasi Dataset ---
+# Semua file CSV di folder ini bisa dipilih dari sidebar
+DATA_DIR = os.environ.get("ENGAGEMENT_DATA_DIR", ".")
+
+# Label partisi untuk seluruh brand (tanpa filter)
+ALL_BRANDS = "Semua Brand"
+
+_hash_cache = {}
+
+
+def list_datasets():
+    """
+    Mendaftar file CSV yang tersedia, dengan dataset bawaan di urutan pertama.
+    """
+    try:
+        files = sorted(f for f in os.listdir(DATA_DIR) if f.lower().endswith('.csv'))
+    except FileNotFoundError:
+        files = []
+    if DATA_FILE in files:
+        files.remove(DATA_FILE)
+        files.insert(0, DATA_FILE)
+    return files
+
+
+def content_hash(path):
+    """
+    Hash SHA-256 isi file. Hasilnya diingat selama ukuran & waktu modifikasi file tidak berubah.
+    """
+    stat = os.stat(path)
+    signature = (stat.st_size, stat.st_mtime_ns)
+    cached = _hash_cache.get(path)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    _hash_cache[path] = (signature, digest.hexdigest())
+    return _hash_cache[path][1]
+
+
+def partition_key(path, brand=None):
+    """
+    Kunci cache sebuah partisi: hash isi file + nama brand (jika difilter).
+    """
+    key = content_hash(path)[:16]
+    if brand and brand != ALL_BRANDS:
+        key += "-" + hashlib.sha256(brand.encode('utf-8')).hexdigest()[:8]
+    return key
+
+
+def model_key(path, brand=None, config=None):
+    """
+    Kunci artefak model (versi model): kunci partisi + hash konfigurasi model.
+    """
+    return f"{partition_key(path, brand)}-{config_hash(config or load_model_config())}"
+
+
+def model_slot(path, brand=None):
+    """
+    Slot artefak model: file dataset + brand, tanpa hash. Versi model baru untuk slot yang
+    sama (isi file atau konfigurasi berubah) menggantikan versi lamanya di ModelStore.
+    """
+    return f"{os.path.abspath(path)}::{brand or ALL_BRANDS}"
+
+
+def list_brands(path):
+    """
+    Mendaftar brand yang ada di dataset (hanya membaca kolom 'brand_name').
+    """
+    brands = pd.read_csv(path, usecols=['brand_name'])['brand_name'].dropna().unique().tolist()
+    return [ALL_BRANDS] + sorted(brands)
+
+
+def load_partition(path, brand=None):
+    """
+    Memuat dataset lalu memfilternya ke satu brand (jika dipilih).
+    """
+    df, df_hashtags, df_keywords = load_data(path)
+    if brand and brand != ALL_BRANDS:
+        df = df[df['brand_name'] == brand]
+        df_hashtags = df_hashtags[df_hashtags['brand_name'] == brand]
+        df_keywords = df_keywords[df_keywords['brand_name'] == brand]
+    return df, df_hashtags, df_keywords
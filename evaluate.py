@@ -0,0 +1,318 @@
+"""
+Evaluasi akurasi model dengan k-fold cross-validation.
+
+Setiap fold di-encode sekali (dipakai bersama oleh model regresi & klasifikasi dan
+disimpan ke cache agar bisa dipakai ulang oleh konfigurasi lain), fold dijalankan
+paralel di process pool, dan hasil per fold di-cache berdasarkan hash dataset +
+hash konfigurasi model.
+
+Waktu fit/predict dan latensi satu baris tidak diukur di dalam pool (fold lain yang
+berjalan bersamaan membuatnya bergantung pada --workers). Setelah pool selesai, model
+dilatih ulang sekali pada fold 0 di proses induk dengan n_jobs seperti di app, dan
+waktunya diukur di sana.
+
+Contoh:
+    python evaluate.py --folds 5
+    python evaluate.py --config kandidat.json --brand Nike --workers 4 --json hasil.json
+"""
+import argparse
+import json
+import os
+import pickle
+import time
+from concurrent.futures import as_completed
+
+import joblib
+import numpy as np
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score, accuracy_score, f1_score
+from sklearn.model_selection import KFold
+from sklearn.pipeline import Pipeline
+
+from analytics import (prepare_model_frame, make_preprocessor, make_estimator, load_model_config,
+                       config_hash, DATA_FILE, FEATURES, TARGETS_REG, TARGET_CLF, MODEL_N_JOBS)
+from datasets import ALL_BRANDS, partition_key, load_partition
+import parallel
+
+# --- Konfigurasi Evaluasi ---
+EVAL_CACHE_DIR = os.environ.get("ENGAGEMENT_EVAL_CACHE_DIR", ".eval_cache")
+LATENCY_REPEATS = 20
+# Naikkan jika format cache encoding atau cara mengukur berubah, agar cache lama tidak dipakai
+EVAL_CACHE_VERSION = 3
+
+
+# --- Data & Fold ---
+def load_eval_data(path, brand=None):
+    """
+    Memuat partisi dan menyiapkan X, y regresi, dan y klasifikasi (sama seperti train_models).
+    """
+    df, _, _ = load_partition(path, brand)
+    frame = prepare_model_frame(df.copy()).reset_index(drop=True)
+    return frame[FEATURES], frame[TARGETS_REG].to_numpy(), frame[TARGET_CLF].to_numpy()
+
+
+def make_folds(n_rows, n_folds, random_state=42):
+    """
+    Indeks (train, test) untuk setiap fold; deterministik untuk data yang sama.
+    """
+    return list(KFold(n_splits=n_folds, shuffle=True, random_state=random_state).split(np.arange(n_rows)))
+
+
+def encode_fold(X, train_idx, test_idx, cache_path=None):
+    """
+    One-hot encoding satu fold (encoder di-fit hanya pada data latih fold tersebut).
+    Mengembalikan (X_train, X_test, encoder); hasilnya disimpan ke `cache_path` agar
+    dipakai ulang oleh evaluasi berikutnya.
+    """
+    if cache_path and os.path.exists(cache_path):
+        return joblib.load(cache_path)
+    preprocessor = make_preprocessor()
+    encoded = (preprocessor.fit_transform(X.iloc[train_idx]), preprocessor.transform(X.iloc[test_idx]), preprocessor)
+    if cache_path:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        joblib.dump(encoded, cache_path)
+    return encoded
+
+
+def predict_latency(kind, model, preprocessor, raw_row, repeats=LATENCY_REPEATS):
+    """
+    Median waktu prediksi satu baris mentah (detik), persis seperti satu permintaan di
+    halaman Prakiraan: Pipeline encoder + model, dengan n_jobs yang sama seperti model app.
+    Panggil saat tidak ada worker lain yang berjalan, agar hasilnya tidak dipengaruhi beban pool.
+    """
+    n_jobs = model.n_jobs
+    model.set_params(n_jobs=MODEL_N_JOBS)
+    pipeline = Pipeline(steps=[('preprocessor', preprocessor), (kind, model)])
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        pipeline.predict(raw_row)
+        timings.append(time.perf_counter() - start)
+    model.set_params(n_jobs=n_jobs)
+    return float(np.median(timings))
+
+
+def fit_and_score_model(kind, params, X_train, X_test, y_train, y_test, n_jobs=1):
+    """
+    Melatih satu model ('regressor' atau 'classifier') pada data yang sudah di-encode,
+    lalu mengukur error dan ukuran model. Mengembalikan (hasil, model).
+    Waktu sengaja tidak diukur di sini (fungsi ini biasanya berjalan di process pool);
+    lihat time_model dan predict_latency.
+    """
+    model = make_estimator(kind, params, n_jobs=n_jobs)
+    model.fit(X_train, y_train)
+    pred = model.predict(X_test)
+
+    if kind == 'regressor':
+        targets = {
+            target: {
+                'mae': float(mean_absolute_error(y_test[:, i], pred[:, i])),
+                'rmse': float(np.sqrt(mean_squared_error(y_test[:, i], pred[:, i]))),
+                'r2': float(r2_score(y_test[:, i], pred[:, i])),
+            }
+            for i, target in enumerate(TARGETS_REG)
+        }
+    else:
+        targets = {
+            TARGET_CLF: {
+                'accuracy': float(accuracy_score(y_test, pred)),
+                'f1_macro': float(f1_score(y_test, pred, average='macro')),
+            }
+        }
+
+    result = {
+        'size_bytes': len(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)),
+        'targets': targets,
+    }
+    return result, model
+
+
+def time_model(kind, params, X_train, X_test, y_train, preprocessor, raw_row):
+    """
+    Mengukur waktu fit, waktu predict seluruh X_test, dan latensi satu baris mentah dengan
+    kondisi seperti di app (n_jobs=MODEL_N_JOBS). Dijalankan di proses induk saat pool
+    tidak berjalan.
+    """
+    model = make_estimator(kind, params, n_jobs=MODEL_N_JOBS)
+    start = time.perf_counter()
+    model.fit(X_train, y_train)
+    fit_time = time.perf_counter() - start
+    start = time.perf_counter()
+    model.predict(X_test)
+    predict_time = time.perf_counter() - start
+    return {
+        'fit_seconds': fit_time,
+        'predict_seconds': predict_time,
+        'latency_seconds': predict_latency(kind, model, preprocessor, raw_row),
+    }
+
+
+def fit_and_score(config, X_train, X_test, y_reg_train, y_reg_test, y_clf_train, y_clf_test, n_jobs=1):
+    """
+    Melatih & mengukur akurasi dan ukuran kedua model dengan `config`.
+    """
+    return {
+        'regressor': fit_and_score_model('regressor', config['regressor'], X_train, X_test,
+                                         y_reg_train, y_reg_test, n_jobs)[0],
+        'classifier': fit_and_score_model('classifier', config['classifier'], X_train, X_test,
+                                          y_clf_train, y_clf_test, n_jobs)[0],
+    }
+
+
+# --- Data Bersama untuk Worker ---
+# Dimuat sekali di proses induk dan dibagikan ke worker lewat parallel.make_pool.
+def load_shared(path, brand, n_folds):
+    X, y_reg, y_clf = load_eval_data(path, brand)
+    return {
+        'data_key': partition_key(path, brand),
+        'X': X, 'y_reg': y_reg, 'y_clf': y_clf,
+        'folds': make_folds(len(X), n_folds),
+    }
+
+
+def _encoding_path(data_key, n_folds, fold):
+    return os.path.join(EVAL_CACHE_DIR, f"enc-v{EVAL_CACHE_VERSION}-{data_key}-k{n_folds}-f{fold}.joblib")
+
+
+def _result_path(data_key, config, n_folds, fold):
+    return os.path.join(EVAL_CACHE_DIR, f"res-v{EVAL_CACHE_VERSION}-{data_key}-{config_hash(config)}-k{n_folds}-f{fold}.json")
+
+
+def _timing_path(data_key, config, n_folds):
+    return os.path.join(EVAL_CACHE_DIR, f"time-v{EVAL_CACHE_VERSION}-{data_key}-{config_hash(config)}-k{n_folds}.json")
+
+
+def run_fold(config, fold):
+    """
+    Menjalankan satu fold: encoding (dari cache jika ada), fit & skor, lalu menyimpan hasilnya.
+    """
+    n_folds = len(parallel.shared['folds'])
+    train_idx, test_idx = parallel.shared['folds'][fold]
+    X_train, X_test, _ = encode_fold(parallel.shared['X'], train_idx, test_idx,
+                                     _encoding_path(parallel.shared['data_key'], n_folds, fold))
+
+    y_reg, y_clf = parallel.shared['y_reg'], parallel.shared['y_clf']
+    result = fit_and_score(config, X_train, X_test, y_reg[train_idx], y_reg[test_idx], y_clf[train_idx], y_clf[test_idx])
+    result['fold'] = fold
+
+    with open(_result_path(parallel.shared['data_key'], config, n_folds, fold), 'w') as f:
+        json.dump(result, f)
+    return result
+
+
+def run_timing(shared, config):
+    """
+    Mengukur waktu kedua model pada fold 0 di proses induk (tanpa worker lain yang berjalan).
+    Hasilnya menyertakan kondisi pengukuran.
+    """
+    n_folds = len(shared['folds'])
+    train_idx, test_idx = shared['folds'][0]
+    X_train, X_test, preprocessor = encode_fold(shared['X'], train_idx, test_idx,
+                                                _encoding_path(shared['data_key'], n_folds, 0))
+    raw_row = shared['X'].iloc[test_idx[:1]]
+    timing = {
+        'regressor': time_model('regressor', config['regressor'], X_train, X_test,
+                                shared['y_reg'][train_idx], preprocessor, raw_row),
+        'classifier': time_model('classifier', config['classifier'], X_train, X_test,
+                                 shared['y_clf'][train_idx], preprocessor, raw_row),
+        'conditions': {'fold': 0, 'n_jobs': MODEL_N_JOBS, 'cpu_count': os.cpu_count(),
+                       'train_rows': len(train_idx), 'latency_repeats': LATENCY_REPEATS},
+    }
+    with open(_timing_path(shared['data_key'], config, n_folds), 'w') as f:
+        json.dump(timing, f)
+    return timing
+
+
+# --- Ringkasan ---
+def summarize(fold_results, timing):
+    """
+    Rata-rata & standar deviasi setiap metrik di semua fold, ditambah hasil pengukuran waktu.
+    """
+    summary = {'timing_conditions': timing['conditions']}
+    for model in ('regressor', 'classifier'):
+        summary[model] = {'size_bytes': float(np.mean([r[model]['size_bytes'] for r in fold_results]))}
+        summary[model].update(timing[model])
+        summary[model]['targets'] = {}
+        for target, metrics in fold_results[0][model]['targets'].items():
+            summary[model]['targets'][target] = {
+                metric: (float(np.mean([r[model]['targets'][target][metric] for r in fold_results])),
+                         float(np.std([r[model]['targets'][target][metric] for r in fold_results])))
+                for metric in metrics
+            }
+    return summary
+
+
+def print_summary(summary, config, n_folds):
+    print(f"\n=== Hasil {n_folds}-fold cross-validation (config {config_hash(config)}) ===")
+    print(f"Konfigurasi: {json.dumps(config)}\n")
+    print(f"{'Target':<18}{'MAE':>22}{'RMSE':>22}{'R²':>18}")
+    for target, m in summary['regressor']['targets'].items():
+        print(f"{target:<18}{m['mae'][0]:>14,.4f} ±{m['mae'][1]:>6,.4f}{m['rmse'][0]:>14,.4f} ±{m['rmse'][1]:>6,.4f}"
+              f"{m['r2'][0]:>10.4f} ±{m['r2'][1]:>6.4f}")
+    m = summary['classifier']['targets'][TARGET_CLF]
+    print(f"\n{TARGET_CLF:<18}akurasi {m['accuracy'][0]:.4f} ±{m['accuracy'][1]:.4f}   "
+          f"F1 makro {m['f1_macro'][0]:.4f} ±{m['f1_macro'][1]:.4f}")
+    print(f"\n{'Model':<12}{'fit (s)':>10}{'predict (s)':>14}{'1 baris (ms)':>15}{'ukuran (MB)':>14}")
+    for model in ('regressor', 'classifier'):
+        s = summary[model]
+        print(f"{model:<12}{s['fit_seconds']:>10.2f}{s['predict_seconds']:>14.3f}"
+              f"{s['latency_seconds'] * 1000:>15.2f}{s['size_bytes'] / 1e6:>14.1f}")
+    c = summary['timing_conditions']
+    print(f"(waktu diukur di proses induk tanpa worker lain: fold {c['fold']}, {c['train_rows']:,} baris latih, "
+          f"n_jobs={c['n_jobs']}, {c['cpu_count']} CPU; ukuran = rata-rata semua fold)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluasi model dengan k-fold cross-validation.")
+    parser.add_argument('--data', default=DATA_FILE, help="Path file CSV dataset.")
+    parser.add_argument('--brand', default=ALL_BRANDS, help="Evaluasi hanya untuk satu brand.")
+    parser.add_argument('--config', help="File JSON konfigurasi model (bawaan: konfigurasi yang dipakai app).")
+    parser.add_argument('--folds', type=int, default=5, help="Jumlah fold.")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Jumlah proses worker.")
+    parser.add_argument('--no-cache', action='store_true', help="Abaikan hasil fold yang sudah di-cache.")
+    parser.add_argument('--json', help="Simpan ringkasan hasil ke file JSON ini.")
+    args = parser.parse_args(argv)
+
+    config = load_model_config(args.config) if args.config else load_model_config()
+    start = time.time()
+    shared = parallel.init_shared(load_shared, (args.data, args.brand, args.folds))
+    os.makedirs(EVAL_CACHE_DIR, exist_ok=True)
+
+    # Fold yang hasilnya sudah ada di cache tidak dijalankan ulang
+    results, pending = {}, []
+    for fold in range(args.folds):
+        cache_path = _result_path(shared['data_key'], config, args.folds, fold)
+        if os.path.exists(cache_path) and not args.no_cache:
+            with open(cache_path) as f:
+                results[fold] = json.load(f)
+        else:
+            pending.append(fold)
+    print(f"{len(shared['X']):,} baris, {args.folds} fold: {len(results)} dari cache, {len(pending)} dijalankan.")
+
+    if pending:
+        with parallel.make_pool(load_shared, (args.data, args.brand, args.folds), min(args.workers, len(pending))) as pool:
+            futures = [pool.submit(run_fold, config, fold) for fold in pending]
+            for future in as_completed(futures):
+                result = future.result()
+                results[result['fold']] = result
+                print(f"  ✓ fold {result['fold']}")
+
+    # Waktu diukur setelah pool selesai, agar tidak dipengaruhi fold lain yang berjalan bersamaan
+    timing_path = _timing_path(shared['data_key'], config, args.folds)
+    if os.path.exists(timing_path) and not args.no_cache:
+        with open(timing_path) as f:
+            timing = json.load(f)
+    else:
+        print("  Mengukur waktu di proses induk...")
+        timing = run_timing(shared, config)
+
+    summary = summarize([results[fold] for fold in range(args.folds)], timing)
+    print_summary(summary, config, args.folds)
+    print(f"\nSelesai dalam {time.time() - start:.1f} detik.")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'config': config, 'folds': args.folds, 'summary': summary}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
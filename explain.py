@@ -0,0 +1,211 @@
+import os
+import threading
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from sklearn.inspection import permutation_importance
+from sklearn.metrics import make_scorer, r2_score, accuracy_score
+from sklearn.model_selection import train_test_split
+
+from analytics import FEATURES, TARGETS_REG, TARGET_CLF, prepare_model_frame, train_models
+
+# --- Konfigurasi Permutation Importance ---
+IMPORTANCE_REPEATS = 5
+IMPORTANCE_MAX_SAMPLES = 2000
+IMPORTANCE_JOBS = int(os.environ.get("ENGAGEMENT_IMPORTANCE_JOBS", "-1"))
+IMPORTANCE_TEST_SIZE = 0.2
+# Penanda cara importance dihitung; artefak dengan penanda lain dihitung ulang
+IMPORTANCE_METHOD = f"holdout-{IMPORTANCE_TEST_SIZE}"
+
+# Jumlah baris input yang penjelasannya diingat per model
+EXPLANATION_CACHE_SIZE = 1024
+
+
+# --- Permutation Importance (Global) ---
+def _r2_for_target(y_true, y_pred, index):
+    """
+    Skor R² untuk satu kolom target dari model multi-output.
+    """
+    return r2_score(np.asarray(y_true)[:, index], np.asarray(y_pred)[:, index])
+
+
+def compute_permutation_importance(artifact, _df, n_repeats=IMPORTANCE_REPEATS,
+                                   max_samples=IMPORTANCE_MAX_SAMPLES, n_jobs=IMPORTANCE_JOBS,
+                                   test_size=IMPORTANCE_TEST_SIZE, random_state=42):
+    """
+    Menghitung permutation importance keenam fitur untuk model regresi (per target, R²)
+    dan model klasifikasi (akurasi) pada data yang tidak pernah dilihat model.
+
+    Model di artefak dilatih dengan seluruh data, jadi mengacak baris latihnya hanya
+    mengukur hafalan. Karena itu model dengan konfigurasi yang sama dilatih ulang pada
+    bagian latih, lalu fitur diacak pada bagian holdout (`test_size`). Permutasi
+    dijalankan paralel di process pool joblib.
+
+    Mengembalikan (importance, skor holdout): {target: {fitur: (rata-rata penurunan skor, std)}}
+    dan {target: skor model holdout tanpa pengacakan}.
+    """
+    _df_cleaned = prepare_model_frame(_df.copy())
+    _df_train, _df_test = train_test_split(_df_cleaned, test_size=test_size, random_state=random_state)
+    pipeline_reg, pipeline_clf, _ = train_models(_df_train.copy(), artifact['config'])
+    if len(_df_test) > max_samples:
+        _df_test = _df_test.sample(max_samples, random_state=random_state)
+    X = _df_test[FEATURES]
+
+    # Satu scorer per target; predict() cukup dipanggil sekali per permutasi untuk semua scorer
+    scoring_reg = {target: make_scorer(_r2_for_target, index=i) for i, target in enumerate(TARGETS_REG)}
+    result_reg = permutation_importance(
+        pipeline_reg, X, _df_test[TARGETS_REG], scoring=scoring_reg,
+        n_repeats=n_repeats, n_jobs=n_jobs, random_state=random_state
+    )
+    result_clf = permutation_importance(
+        pipeline_clf, X, _df_test[TARGET_CLF], scoring=make_scorer(accuracy_score),
+        n_repeats=n_repeats, n_jobs=n_jobs, random_state=random_state
+    )
+
+    pred_reg = pipeline_reg.predict(X)
+    scores = {target: float(r2_score(_df_test[target], pred_reg[:, i])) for i, target in enumerate(TARGETS_REG)}
+    scores[TARGET_CLF] = float(accuracy_score(_df_test[TARGET_CLF], pipeline_clf.predict(X)))
+
+    importance = {}
+    for target, result in list(result_reg.items()) + [(TARGET_CLF, result_clf)]:
+        importance[target] = {
+            feature: (float(mean), float(std))
+            for feature, mean, std in zip(FEATURES, result.importances_mean, result.importances_std)
+        }
+    return importance, scores
+
+
+def ensure_importance(model_store, key, build, _df):
+    """
+    Memastikan artefak model `key` memiliki permutation importance holdout (dihitung sekali
+    per versi model, lalu disimpan bersama artefak di disk).
+    """
+    artifact = model_store.get(key, build)
+    if artifact.get('importance_method') != IMPORTANCE_METHOD:
+        importance, scores = compute_permutation_importance(artifact, _df)
+        artifact = model_store.update(key, build, importance=importance, importance_scores=scores,
+                                      importance_method=IMPORTANCE_METHOD)
+    return artifact['importance']
+
+
+# --- Kontribusi per Prediksi (Lokal) ---
+class ForestExplainer:
+    """
+    Memecah prediksi Random Forest menjadi bias + kontribusi tiap fitur asli
+    (dekomposisi jalur pohon): setiap split menyumbang perubahan nilai node ke fitur
+    yang dipakai split tersebut. Kolom one-hot dijumlahkan kembali ke fitur aslinya,
+    sehingga bias + total kontribusi = prediksi model.
+
+    Penjelasan dihitung per batch dan diingat per baris input (LRU).
+    """
+
+    def __init__(self, pipeline):
+        self.preprocessor = pipeline[:-1]
+        forest = pipeline[-1]
+        self.estimators = forest.estimators_
+        self.is_classifier = hasattr(forest, 'classes_')
+        if self.is_classifier:
+            self.outputs = list(forest.classes_)
+        else:
+            self.outputs = list(TARGETS_REG)
+
+        # Pemetaan kolom hasil one-hot -> indeks fitur asli
+        encoded_names = self.preprocessor.get_feature_names_out()
+        self.group_of_column = np.array([
+            next(i for i, feature in enumerate(FEATURES) if name.startswith(f"cat__{feature}_"))
+            for name in encoded_names
+        ])
+
+        self._tables = None
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _tree_tables(self):
+        """
+        Tabel per pohon (parent, nilai node, fitur asli dari split parent), dibuat sekali.
+        """
+        if self._tables is None:
+            tables = []
+            for estimator in self.estimators:
+                tree = estimator.tree_
+                left, right = tree.children_left, tree.children_right
+                internal = np.flatnonzero(left >= 0)
+                parent = np.full(tree.node_count, -1)
+                parent[left[internal]] = internal
+                parent[right[internal]] = internal
+
+                value = tree.value.reshape(tree.node_count, -1)
+                if self.is_classifier:
+                    value = value / value.sum(axis=1, keepdims=True)
+
+                group = np.full(tree.node_count, -1)
+                has_parent = parent >= 0
+                group[has_parent] = self.group_of_column[tree.feature[parent[has_parent]]]
+                tables.append((parent, value, group))
+            self._tables = tables
+        return self._tables
+
+    def _explain_batch(self, X):
+        X_encoded = self.preprocessor.transform(X)
+        contributions = np.zeros((X_encoded.shape[0], len(FEATURES), len(self.outputs)))
+
+        for estimator, (parent, value, group) in zip(self.estimators, self._tree_tables()):
+            path = estimator.decision_path(X_encoded).tocoo()
+            rows, nodes = path.row, path.col
+            mask = parent[nodes] >= 0  # Node akar tidak punya split penyebab
+            rows, nodes = rows[mask], nodes[mask]
+            np.add.at(contributions, (rows, group[nodes]), value[nodes] - value[parent[nodes]])
+
+        return contributions / len(self.estimators)
+
+    @property
+    def bias(self):
+        """
+        Nilai dasar model (rata-rata nilai node akar semua pohon).
+        """
+        return np.mean([value[0] for _, value, _ in self._tree_tables()], axis=0)
+
+    def explain(self, X):
+        """
+        Menjelaskan satu batch baris input (DataFrame dengan kolom FEATURES).
+
+        Mengembalikan (bias, kontribusi) dengan bentuk (n_output,) dan
+        (n_baris, n_fitur, n_output). Baris yang sudah pernah dijelaskan diambil dari cache.
+        """
+        keys = [tuple(row) for row in X[FEATURES].itertuples(index=False)]
+        found = {}
+        with self._lock:
+            for key in keys:
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    found[key] = self._cache[key]
+
+        # Baris baru dijelaskan sekaligus dalam satu batch
+        missing = [key for key in dict.fromkeys(keys) if key not in found]
+        if missing:
+            computed = self._explain_batch(pd.DataFrame(missing, columns=FEATURES))
+            with self._lock:
+                for key, contribution in zip(missing, computed):
+                    found[key] = self._cache[key] = contribution
+                while len(self._cache) > EXPLANATION_CACHE_SIZE:
+                    self._cache.popitem(last=False)
+
+        return self.bias, np.stack([found[key] for key in keys])
+
+
+# Explainer diingat per objek pipeline; ikut hilang saat model dikeluarkan dari ModelStore
+_explainers = weakref.WeakKeyDictionary()
+_explainers_lock = threading.Lock()
+
+
+def get_explainer(pipeline):
+    """
+    Mengambil (atau membuat) ForestExplainer untuk sebuah pipeline.
+    """
+    with _explainers_lock:
+        explainer = _explainers.get(pipeline)
+        if explainer is None:
+            explainer = _explainers[pipeline] = ForestExplainer(pipeline)
+        return explainer
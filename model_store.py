@@ -0,0 +1,130 @@
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import joblib
+
+# --- Konfigurasi Penyimpanan Model ---
+MODEL_DIR = os.environ.get("ENGAGEMENT_MODEL_DIR", ".model_cache")
+MODEL_BUDGET_MB = float(os.environ.get("ENGAGEMENT_MODEL_BUDGET_MB", "1024"))
+# Versi terbaru artefak per slot (misal: satu file dataset + brand), lihat ModelStore._supersede
+SLOTS_FILE = "slots.json"
+LOCK_STRIPES = 16  # Jumlah kunci pelatihan; partisi dibagi ke kunci-kunci ini berdasarkan hash key
+
+
+class ModelStore:
+    """
+    Cache model per partisi dengan batas memori (LRU).
+
+    Setiap artefak (dict berisi pipeline & metadata) disimpan ke disk saat pertama
+    kali dilatih. Jika total ukuran artefak di memori melebihi anggaran, partisi yang
+    paling lama tidak dipakai dikeluarkan dari memori dan dimuat ulang dari disk saat
+    dibutuhkan lagi. Artefak versi lama sebuah slot (hash isi dataset atau konfigurasi yang
+    sudah berganti) dihapus saat versi barunya dipakai, agar folder model tidak terus membesar.
+    """
+
+    def __init__(self, model_dir=MODEL_DIR, budget_mb=MODEL_BUDGET_MB):
+        self.model_dir = model_dir
+        self.budget_bytes = int(budget_mb * 1024 * 1024)
+        self._entries = OrderedDict()  # key -> (artifact, ukuran dalam byte)
+        self._lock = threading.Lock()
+        self._key_locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+
+    def _path(self, key):
+        return os.path.join(self.model_dir, f"{key}.joblib")
+
+    def _key_lock(self, key):
+        return self._key_locks[hash(key) % len(self._key_locks)]
+
+    def _dump(self, key, artifact):
+        os.makedirs(self.model_dir, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        joblib.dump(artifact, tmp_path)
+        os.replace(tmp_path, path)  # Atomik: pembaca tidak pernah melihat file setengah jadi
+        return os.path.getsize(path)
+
+    def _supersede(self, slot, key):
+        """
+        Mencatat `key` sebagai versi terbaru `slot` lalu menghapus artefak versi sebelumnya
+        dari memori & disk (kecuali masih menjadi versi terbaru slot lain).
+        """
+        slots_path = os.path.join(self.model_dir, SLOTS_FILE)
+        with self._lock:
+            try:
+                with open(slots_path, encoding='utf-8') as f:
+                    slots = json.load(f)
+            except (FileNotFoundError, ValueError):
+                slots = {}
+            previous = slots.get(slot)
+            if previous == key:
+                return
+            slots[slot] = key
+            os.makedirs(self.model_dir, exist_ok=True)
+            tmp_path = f"{slots_path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(slots, f, indent=2)
+            os.replace(tmp_path, slots_path)
+
+            if previous is not None and previous not in slots.values():
+                self._entries.pop(previous, None)
+                try:
+                    os.remove(self._path(previous))
+                except FileNotFoundError:
+                    pass
+
+    def _remember(self, key, artifact, size):
+        with self._lock:
+            self._entries[key] = (artifact, size)
+            self._entries.move_to_end(key)
+            # Keluarkan partisi terdingin, tapi selalu simpan yang baru saja dipakai
+            while len(self._entries) > 1 and self.memory_bytes > self.budget_bytes:
+                self._entries.popitem(last=False)
+
+    @property
+    def memory_bytes(self):
+        return sum(size for _, size in self._entries.values())
+
+    def get(self, key, build, slot=None):
+        """
+        Mengambil artefak `key` dari memori, lalu dari disk, dan terakhir dengan
+        memanggil `build()` (hasilnya langsung disimpan ke disk). Jika `slot` diberikan,
+        artefak versi sebelumnya untuk slot itu dihapus.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[0]
+
+        # Kunci per partisi (lewat stripe) agar satu model tidak dilatih dua kali secara bersamaan
+        with self._key_lock(key):
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry is not None:
+                return entry[0]
+
+            path = self._path(key)
+            if os.path.exists(path):
+                artifact = joblib.load(path)
+                size = os.path.getsize(path)
+            else:
+                artifact = build()
+                size = self._dump(key, artifact)
+            self._remember(key, artifact, size)
+            if slot is not None:
+                self._supersede(slot, key)
+            return artifact
+
+    def update(self, key, build, **fields):
+        """
+        Menambahkan/mengganti field pada artefak `key` lalu menyimpannya ulang ke disk
+        (misal: hasil permutation importance untuk versi model ini).
+        """
+        artifact = self.get(key, build)
+        with self._key_lock(key):
+            artifact.update(fields)
+            size = self._dump(key, artifact)
+            self._remember(key, artifact, size)
+        return artifact
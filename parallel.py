@@ -0,0 +1,37 @@
+"""
+Process pool bersama untuk CLI (report.py, evaluate.py, tune.py).
+
+Data yang dibutuhkan worker (dataset, agregat, model, encoding) dimuat sekali di proses
+induk dengan `init_shared` sebelum pool dibuat. Dengan start method 'fork' worker
+mewarisinya (copy-on-write) tanpa pickling; dengan 'spawn', initializer memanggil
+loader yang sama di setiap worker (loader harus fungsi level modul).
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# Data bersama milik proses ini (induk atau worker); diakses sebagai parallel.shared
+shared = None
+
+
+def init_shared(loader, args):
+    """
+    Memuat data bersama di proses ini dengan `loader(*args)` dan mengembalikannya.
+    """
+    global shared
+    shared = loader(*args)
+    return shared
+
+
+def _init_worker(loader, args):
+    if shared is None:
+        init_shared(loader, args)
+
+
+def make_pool(loader, args, workers):
+    """
+    ProcessPoolExecutor dengan `workers` proses yang semuanya memiliki data bersama
+    `loader(*args)` (diwarisi lewat 'fork', atau dimuat ulang oleh initializer).
+    """
+    context = multiprocessing.get_context('fork') if 'fork' in multiprocessing.get_all_start_methods() else None
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                               initializer=_init_worker, initargs=(loader, tuple(args)))
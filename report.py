@@ -0,0 +1,298 @@
+"""
+Generator laporan engagement statis (HTML) per brand atau per campaign.
+
+Contoh:
+    python report.py --by brand --out reports
+    python report.py --by campaign --workers 8 --only BlackFriday CyberMonday
+"""
+import argparse
+import hashlib
+import html
+import os
+import re
+import time
+from concurrent.futures import as_completed
+
+import joblib
+import pandas as pd
+
+from analytics import load_data, prepare_model_frame, build_model_artifact, golden_combos, DATA_FILE, FEATURES
+from datasets import content_hash, model_key, model_slot, load_partition
+from model_store import ModelStore, MODEL_DIR
+import parallel
+
+# --- Konfigurasi Laporan ---
+GROUP_COLUMNS = {'brand': 'brand_name', 'campaign': 'campaign_name'}
+REPORT_CACHE_DIR = os.environ.get("ENGAGEMENT_REPORT_CACHE_DIR", ".report_cache")
+TOP_N = 10
+# Naikkan jika isi agregat (TOP_N, kolom, cara hitung) berubah, agar cache lama tidak dipakai
+AGGREGATES_VERSION = 2
+DAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+REPORT_CSS = """
+body { font-family: sans-serif; margin: 40px auto; max-width: 1000px; color: #222; }
+h1 { color: #6a11cb; }
+h2 { color: #2575fc; border-bottom: 2px solid #e0eaff; padding-bottom: 4px; margin-top: 32px; }
+.kpis { display: flex; flex-wrap: wrap; gap: 12px; }
+.kpi { background: #f4f7ff; border-left: 5px solid #6a11cb; border-radius: 10px; padding: 12px 18px; min-width: 150px; }
+.kpi .label { font-size: 0.85rem; opacity: 0.8; }
+.kpi .value { font-size: 1.5rem; font-weight: bold; }
+table { border-collapse: collapse; margin: 8px 0; }
+th, td { border: 1px solid #dde3f0; padding: 6px 10px; text-align: left; }
+th { background: #e0eaff; }
+.note { background: rgba(37, 117, 252, 0.1); border-radius: 10px; padding: 12px; }
+"""
+
+
+# --- Agregat Bersama (dihitung sekali untuk semua grup) ---
+def compute_group_aggregates(df, df_hashtags, df_keywords, by):
+    """
+    Menghitung semua agregat laporan untuk seluruh grup sekaligus (groupby vektor),
+    sehingga worker cukup mengambil potongan grupnya.
+    """
+    aggregates = {}
+    aggregates['kpi'] = df.groupby(by).agg(
+        posts=('engagement_rate', 'size'),
+        avg_engagement=('engagement_rate', 'mean'),
+        avg_likes=('likes_count', 'mean'),
+        avg_shares=('shares_count', 'mean'),
+        avg_comments=('comments_count', 'mean'),
+        total_impressions=('impressions', 'sum'),
+        avg_toxicity=('toxicity_score', 'mean'),
+    )
+    aggregates['global'] = {
+        'avg_engagement': df['engagement_rate'].mean(),
+    }
+
+    for name, column in (('platform', 'platform'), ('day', 'day_of_week'), ('language', 'language')):
+        aggregates[name] = df.groupby([by, column]).agg(
+            posts=('engagement_rate', 'size'),
+            avg_engagement=('engagement_rate', 'mean'),
+        )
+
+    for name, frame, column in (('hashtag', df_hashtags, 'hashtag'), ('keyword', df_keywords, 'keyword')):
+        counts = frame.dropna(subset=[column]).groupby([by, column]).agg(
+            posts=('engagement_rate', 'size'),
+            avg_engagement=('engagement_rate', 'mean'),
+        )
+        aggregates[name] = counts.sort_values('posts', ascending=False).groupby(level=0).head(TOP_N)
+
+    # Golden Combo per grup (kode yang sama dengan get_advanced_metrics, untuk semua grup sekaligus)
+    aggregates['golden'] = golden_combos(df, by)
+
+    # Profil konten khas tiap grup (nilai fitur paling sering) sebagai dasar tabel prakiraan
+    model_frame = prepare_model_frame(df.copy())
+    aggregates['profile'] = model_frame.groupby(by)[FEATURES].agg(lambda x: x.mode().iloc[0])
+    return aggregates
+
+
+def load_group_aggregates(path, df, df_hashtags, df_keywords, by):
+    """
+    Agregat grup dengan cache di disk, dikunci oleh hash isi dataset, kolom grup, versi
+    agregat, dan TOP_N.
+    """
+    cache_path = os.path.join(REPORT_CACHE_DIR,
+                              f"{content_hash(path)[:16]}-{by}-v{AGGREGATES_VERSION}-top{TOP_N}.joblib")
+    if os.path.exists(cache_path):
+        return joblib.load(cache_path)
+    aggregates = compute_group_aggregates(df, df_hashtags, df_keywords, by)
+    os.makedirs(REPORT_CACHE_DIR, exist_ok=True)
+    joblib.dump(aggregates, cache_path)
+    return aggregates
+
+
+# --- Data Bersama untuk Worker ---
+# Dimuat sekali di proses induk dan dibagikan ke worker lewat parallel.make_pool.
+def load_shared(path, by, model_dir):
+    """
+    Memuat data, agregat grup, dan model global (hanya untuk laporan per campaign;
+    model per brand dimuat worker lewat group_artifact).
+    """
+    df, df_hashtags, df_keywords = load_data(path)
+    aggregates = load_group_aggregates(path, df, df_hashtags, df_keywords, by)
+    model_store = ModelStore(model_dir)
+    shared = {'by': by, 'path': path, 'aggregates': aggregates, 'model_store': model_store}
+    if by != GROUP_COLUMNS['brand']:
+        # Laporan per campaign memakai model global (seluruh brand)
+        shared['artifact'] = model_store.get(model_key(path), lambda: build_model_artifact(df), slot=model_slot(path))
+    return shared
+
+
+def group_artifact(group):
+    """
+    Model untuk tabel prakiraan `group`. Laporan per brand memakai model partisi brand itu
+    (sama dengan halaman Prakiraan di dashboard untuk brand tersebut); selain itu model global.
+    """
+    if parallel.shared['by'] != GROUP_COLUMNS['brand']:
+        return parallel.shared['artifact']
+    path = parallel.shared['path']
+    return parallel.shared['model_store'].get(
+        model_key(path, group), lambda: build_model_artifact(load_partition(path, group)[0]),
+        slot=model_slot(path, group))
+
+
+# --- Pembuatan Laporan per Grup ---
+def _slug(name):
+    """
+    Nama file yang aman dan unik: bagian yang bisa dibaca + hash pendek nama aslinya
+    (nama yang hanya berbeda tanda baca atau berhuruf non-ASCII tidak saling menimpa).
+    """
+    readable = re.sub(r'[^A-Za-z0-9_-]+', '-', str(name)).strip('-') or 'grup'
+    return f"{readable}-{hashlib.sha256(str(name).encode('utf-8')).hexdigest()[:8]}"
+
+
+def _table(frame, percent_columns=()):
+    frame = frame.copy()
+    for column in percent_columns:
+        frame[column] = frame[column].map(lambda v: f"{v:.2%}")
+    return frame.to_html(index=False, border=0)
+
+
+def forecast_table(artifact, profile):
+    """
+    Prakiraan engagement untuk setiap kombinasi platform x hari, dengan bahasa, keyword,
+    hashtag, dan campaign khas grup.
+    """
+    platforms = sorted(artifact['unique_values']['platform'])
+    grid = pd.DataFrame([
+        {**profile, 'platform': platform, 'day_of_week': day}
+        for platform in platforms for day in DAYS
+    ])[FEATURES]
+    pred = artifact['pipeline_reg'].predict(grid)
+    grid['engagement_rate'] = pred[:, -1]
+    table = grid.pivot(index='platform', columns='day_of_week', values='engagement_rate')[DAYS]
+    return table
+
+
+def render_group_report(group, out_dir):
+    """
+    Membuat satu file HTML untuk `group` dan mengembalikan ringkasannya.
+    """
+    by = parallel.shared['by']
+    aggregates = parallel.shared['aggregates']
+    kpi = aggregates['kpi'].loc[group]
+    global_avg = aggregates['global']['avg_engagement']
+    title = html.escape(str(group))
+
+    sections = [f"<h1>Laporan Engagement: {title}</h1>"]
+
+    # 1. KPI
+    kpi_items = [
+        ("Total Postingan", f"{int(kpi['posts']):,}"),
+        ("Rata-rata Engagement", f"{kpi['avg_engagement']:.2%}"),
+        ("Rata-rata Likes", f"{kpi['avg_likes']:,.0f}"),
+        ("Rata-rata Shares", f"{kpi['avg_shares']:,.0f}"),
+        ("Rata-rata Comments", f"{kpi['avg_comments']:,.0f}"),
+        ("Total Impresi", f"{int(kpi['total_impressions']):,}"),
+        ("Rata-rata Toksisitas", f"{kpi['avg_toxicity']:.2%}"),
+    ]
+    sections.append("<h2>1. KPI</h2><div class='kpis'>" + "".join(
+        f"<div class='kpi'><div class='label'>{label}</div><div class='value'>{value}</div></div>"
+        for label, value in kpi_items
+    ) + "</div>")
+    diff = kpi['avg_engagement'] - global_avg
+    sections.append(
+        f"<p class='note'>Rata-rata engagement {title} <strong>{'di atas' if diff >= 0 else 'di bawah'}</strong> "
+        f"rata-rata seluruh data ({global_avg:.2%}) sebesar {abs(diff):.2%}.</p>"
+    )
+
+    # 2. Rangking
+    sections.append("<h2>2. Rangking</h2>")
+    for name, label, column in (('platform', 'Platform', 'Platform'), ('day', 'Hari Upload', 'Hari'),
+                                ('language', 'Bahasa', 'Bahasa')):
+        ranking = aggregates[name].loc[group].sort_values('avg_engagement', ascending=False).reset_index()
+        ranking.columns = [column, 'Jumlah Post', 'Rata-rata Engagement']
+        sections.append(f"<h3>{label}</h3>" + _table(ranking, percent_columns=['Rata-rata Engagement']))
+
+    # 3. Top Hashtag & Keyword
+    sections.append(f"<h2>3. Top {TOP_N} Hashtag & Keyword</h2>")
+    for name, label in (('hashtag', 'Hashtag'), ('keyword', 'Keyword')):
+        top = aggregates[name].loc[group].reset_index()
+        top.columns = [label, 'Jumlah', 'Rata-rata Engagement']
+        sections.append(f"<h3>{label}</h3>" + _table(top, percent_columns=['Rata-rata Engagement']))
+
+    # 4. Golden Combo
+    golden = aggregates['golden'].loc[group]
+    (g_plat, g_day, g_lang), g_avg = golden.index[0], golden.iloc[0]
+    sections.append(
+        f"<h2>4. Kombinasi Emas</h2><p class='note'><strong>{html.escape(g_plat)}</strong> + "
+        f"<strong>{html.escape(g_day)}</strong> + <strong>{html.escape(g_lang)}</strong>, "
+        f"dengan rata-rata engagement {g_avg:.2%}.</p>"
+    )
+
+    # 5. Prakiraan
+    profile = aggregates['profile'].loc[group].to_dict()
+    table = forecast_table(group_artifact(group), profile)
+    best_platform, best_day = table.stack().idxmax()
+    model_note = (f"model brand {title} (sama dengan halaman Prakiraan di dashboard untuk brand ini)"
+                  if by == GROUP_COLUMNS['brand'] else "model global yang dilatih dengan data seluruh brand")
+    sections.append(
+        "<h2>5. Prakiraan Engagement Rate (Platform x Hari)</h2>"
+        f"<p>Prakiraan dibuat dengan {model_note}.</p>"
+        f"<p>Profil konten: bahasa <strong>{html.escape(str(profile['language']))}</strong>, "
+        f"keyword <strong>{html.escape(str(profile['keyword_model']))}</strong>, "
+        f"hashtag <strong>{html.escape(str(profile['hashtag_model']))}</strong>, "
+        f"campaign <strong>{html.escape(str(profile['campaign_name']))}</strong>.</p>"
+        + table.map(lambda v: f"{v:.2%}").to_html(border=0)
+        + f"<p class='note'>Slot terbaik menurut model: <strong>{html.escape(best_platform)}</strong> "
+          f"pada hari <strong>{html.escape(best_day)}</strong> ({table.loc[best_platform, best_day]:.2%}).</p>"
+    )
+
+    filename = f"{_slug(group)}.html"
+    with open(os.path.join(out_dir, filename), 'w', encoding='utf-8') as f:
+        f.write(f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>Laporan {title}</title>"
+                f"<style>{REPORT_CSS}</style></head><body>{''.join(sections)}</body></html>")
+
+    return {'group': group, 'file': filename, 'posts': int(kpi['posts']), 'avg_engagement': kpi['avg_engagement']}
+
+
+def write_index(summaries, by, out_dir):
+    """
+    Halaman indeks berisi tautan ke semua laporan, diurutkan menurut engagement.
+    """
+    rows = "".join(
+        f"<tr><td><a href='{s['file']}'>{html.escape(str(s['group']))}</a></td>"
+        f"<td>{s['posts']:,}</td><td>{s['avg_engagement']:.2%}</td></tr>"
+        for s in sorted(summaries, key=lambda s: s['avg_engagement'], reverse=True)
+    )
+    with open(os.path.join(out_dir, "index.html"), 'w', encoding='utf-8') as f:
+        f.write(f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>Laporan per {by}</title>"
+                f"<style>{REPORT_CSS}</style></head><body><h1>Laporan Engagement per {by.title()}</h1>"
+                f"<table><tr><th>{by.title()}</th><th>Jumlah Post</th><th>Rata-rata Engagement</th></tr>"
+                f"{rows}</table></body></html>")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Membuat laporan engagement HTML per brand atau campaign.")
+    parser.add_argument('--data', default=DATA_FILE, help="Path file CSV dataset.")
+    parser.add_argument('--by', choices=sorted(GROUP_COLUMNS), default='brand', help="Kelompokkan laporan per brand atau campaign.")
+    parser.add_argument('--out', default='reports', help="Folder output laporan HTML.")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Jumlah proses worker.")
+    parser.add_argument('--only', nargs='*', help="Hanya buat laporan untuk grup-grup ini.")
+    parser.add_argument('--model-dir', default=MODEL_DIR, help="Folder artefak model.")
+    args = parser.parse_args(argv)
+
+    start = time.time()
+    by = GROUP_COLUMNS[args.by]
+    shared = parallel.init_shared(load_shared, (args.data, by, args.model_dir))
+    groups = args.only or shared['aggregates']['kpi'].index.tolist()
+    missing = [g for g in groups if g not in shared['aggregates']['kpi'].index]
+    if missing:
+        parser.error(f"Grup tidak ditemukan: {', '.join(map(str, missing))}")
+    print(f"Data, agregat & model siap dalam {time.time() - start:.1f} detik. Membuat {len(groups)} laporan...")
+
+    os.makedirs(args.out, exist_ok=True)
+    summaries = []
+    with parallel.make_pool(load_shared, (args.data, by, args.model_dir), args.workers) as pool:
+        futures = {pool.submit(render_group_report, group, args.out): group for group in groups}
+        for future in as_completed(futures):
+            summary = future.result()
+            summaries.append(summary)
+            print(f"  ✓ {summary['group']} -> {os.path.join(args.out, summary['file'])}")
+
+    write_index(summaries, args.by, args.out)
+    print(f"Selesai: {len(summaries)} laporan di '{args.out}' dalam {time.time() - start:.1f} detik.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""
+Pencarian hyperparameter model prakiraan dengan successive halving.
+
+Untuk model regresi dan klasifikasi secara terpisah, sejumlah kandidat konfigurasi
+(backend, jumlah pohon, kedalaman, ukuran daun, max_features) dievaluasi pada
+sebagian kecil data latih. Sepertiga terbaik (eta=3) lanjut ke babak berikutnya dengan
+data latih tiga kali lebih banyak, sampai babak terakhir memakai seluruh data latih.
+Kandidat dalam satu babak dievaluasi paralel di process pool.
+
+Skor gabungan (semakin kecil semakin baik):
+    error holdout + bobot_ukuran x ukuran model (MB) + bobot_latensi x latensi 1 baris (ms)
+
+Latensi diukur seperti permintaan di app: satu baris mentah lewat encoder + model, dengan
+n_jobs yang sama seperti model yang dipakai app (MODEL_N_JOBS). Hanya fitting yang berjalan
+paralel; worker menyimpan model ke file sementara, lalu setelah semua kandidat satu babak
+selesai proses induk mengukur latensinya satu per satu saat pool tidak berjalan.
+
+Error regresi = rata-rata RMSE / std target (1.0 = sama dengan menebak rata-rata);
+error klasifikasi = 1 - akurasi. Konfigurasi terpilih harus memenuhi batas akurasi:
+error <= error konfigurasi bawaan x (1 + toleransi). Hasilnya ditulis ke
+model_config.json dan otomatis dipakai train_models.
+
+Contoh:
+    python tune.py
+    python tune.py --candidates 27 --tolerance 0.02 --size-weight 0.002 --dry-run
+"""
+import argparse
+import json
+import math
+import os
+import random
+import tempfile
+import time
+
+import joblib
+import numpy as np
+from sklearn.model_selection import train_test_split
+
+from analytics import DEFAULT_MODEL_CONFIG, MODEL_CONFIG_FILE, BACKENDS, DATA_FILE, TARGET_CLF
+from datasets import ALL_BRANDS, partition_key
+from evaluate import (EVAL_CACHE_DIR, EVAL_CACHE_VERSION, load_eval_data, encode_fold, fit_and_score_model,
+                      predict_latency)
+import parallel
+
+# --- Ruang Pencarian ---
+SEARCH_SPACE = {
+    'backend': sorted(BACKENDS),
+    'n_estimators': [25, 50, 100, 200],
+    'max_depth': [None, 8, 12, 16, 24],
+    'min_samples_leaf': [1, 2, 5, 10, 20],
+    'max_features': [1.0, 0.5, 0.3, 'sqrt'],
+}
+MIN_RESOURCE = 200  # Jumlah baris latih minimum di babak pertama
+
+
+def sample_candidates(n_candidates, kind, random_state=42):
+    """
+    Sampel acak konfigurasi unik dari SEARCH_SPACE, selalu termasuk konfigurasi bawaan.
+    """
+    rng = random.Random(random_state)
+    candidates = [dict(DEFAULT_MODEL_CONFIG[kind])]
+    seen = {json.dumps(candidates[0], sort_keys=True)}
+    max_unique = math.prod(len(values) for values in SEARCH_SPACE.values())
+    while len(candidates) < min(n_candidates, max_unique):
+        candidate = {name: rng.choice(values) for name, values in SEARCH_SPACE.items()}
+        key = json.dumps(candidate, sort_keys=True)
+        if key not in seen:
+            seen.add(key)
+            candidates.append(candidate)
+    return candidates
+
+
+def holdout_error(kind, result, y_test):
+    """
+    Error holdout yang bisa dibandingkan antar konfigurasi (lihat docstring modul).
+    """
+    if kind == 'regressor':
+        std = y_test.std(axis=0)
+        return float(np.mean([m['rmse'] / s for m, s in zip(result['targets'].values(), std)]))
+    return 1.0 - result['targets'][TARGET_CLF]['accuracy']
+
+
+def objective(trial, size_weight, latency_weight):
+    return trial['error'] + size_weight * trial['size_mb'] + latency_weight * trial['latency_ms']
+
+
+# --- Data Bersama untuk Worker ---
+# Dimuat sekali di proses induk dan dibagikan ke worker lewat parallel.make_pool.
+def load_shared(path, brand, test_size):
+    X, y_reg, y_clf = load_eval_data(path, brand)
+    train_idx, test_idx = train_test_split(np.arange(len(X)), test_size=test_size, random_state=42)
+    cache_path = os.path.join(EVAL_CACHE_DIR, f"enc-v{EVAL_CACHE_VERSION}-{partition_key(path, brand)}-holdout{test_size}.joblib")
+    X_train, X_test, preprocessor = encode_fold(X, train_idx, test_idx, cache_path)
+    # Urutan acak tetap: subset babak kecil selalu bagian dari subset babak berikutnya
+    order = np.random.default_rng(42).permutation(len(train_idx))
+    return {
+        'X_train': X_train[order], 'X_test': X_test,
+        # Latensi diukur seperti di app: satu baris mentah lewat encoder + model
+        'preprocessor': preprocessor, 'raw_row': X.iloc[test_idx[:1]],
+        'y': {
+            'regressor': (y_reg[train_idx][order], y_reg[test_idx]),
+            'classifier': (y_clf[train_idx][order], y_clf[test_idx]),
+        },
+    }
+
+
+def run_trial(kind, params, n_rows, model_path):
+    """
+    Melatih `params` pada `n_rows` baris latih pertama dan mengukurnya pada data holdout.
+    Model disimpan ke `model_path` agar latensinya bisa diukur di proses induk.
+    """
+    y_train, y_test = parallel.shared['y'][kind]
+    result, model = fit_and_score_model(kind, params, parallel.shared['X_train'][:n_rows], parallel.shared['X_test'],
+                                        y_train[:n_rows], y_test)
+    joblib.dump(model, model_path)
+    return {
+        'params': params,
+        'rows': n_rows,
+        'error': holdout_error(kind, result, y_test),
+        'size_mb': result['size_bytes'] / 1e6,
+    }
+
+
+def measure_latency(kind, trials, model_paths):
+    """
+    Mengukur latensi setiap kandidat di proses induk, satu per satu, setelah pool selesai.
+    """
+    for trial, path in zip(trials, model_paths):
+        model = joblib.load(path)
+        trial['latency_ms'] = predict_latency(kind, model, parallel.shared['preprocessor'],
+                                              parallel.shared['raw_row']) * 1000
+        os.remove(path)
+
+
+def successive_halving(pool, kind, candidates, n_train, eta, size_weight, latency_weight):
+    """
+    Menjalankan babak-babak successive halving dan mengembalikan hasil babak terakhir
+    (semua kandidat yang bertahan, dievaluasi dengan seluruh data latih).
+    """
+    n_rounds = max(1, math.floor(math.log(len(candidates), eta)) + 1)
+    survivors = candidates
+    for round_index in range(n_rounds):
+        n_rows = n_train if round_index == n_rounds - 1 else max(MIN_RESOURCE, n_train // eta ** (n_rounds - 1 - round_index))
+        start = time.time()
+        with tempfile.TemporaryDirectory(prefix='tune-') as model_dir:
+            model_paths = [os.path.join(model_dir, f"{i}.joblib") for i in range(len(survivors))]
+            trials = list(pool.map(run_trial, [kind] * len(survivors), survivors, [n_rows] * len(survivors), model_paths))
+            measure_latency(kind, trials, model_paths)
+        trials.sort(key=lambda t: objective(t, size_weight, latency_weight))
+        print(f"  [{kind}] babak {round_index + 1}/{n_rounds}: {len(survivors)} kandidat x {n_rows:,} baris "
+              f"({time.time() - start:.1f} s), terbaik skor {objective(trials[0], size_weight, latency_weight):.4f}")
+        if round_index < n_rounds - 1:
+            survivors = [t['params'] for t in trials[:max(1, len(trials) // eta)]]
+            # Konfigurasi bawaan selalu ikut sampai akhir sebagai pembanding batas akurasi
+            if DEFAULT_MODEL_CONFIG[kind] not in survivors:
+                survivors.append(dict(DEFAULT_MODEL_CONFIG[kind]))
+    return trials
+
+
+def choose(kind, trials, tolerance, size_weight, latency_weight):
+    """
+    Memilih kandidat dengan skor gabungan terbaik yang memenuhi batas akurasi.
+    """
+    baseline = next(t for t in trials if t['params'] == DEFAULT_MODEL_CONFIG[kind])
+    error_bar = baseline['error'] * (1 + tolerance)
+    eligible = [t for t in trials if t['error'] <= error_bar]
+    best = min(eligible, key=lambda t: objective(t, size_weight, latency_weight))
+    return best, baseline, error_bar
+
+
+def _describe(trial):
+    return (f"error {trial['error']:.4f}, ukuran {trial['size_mb']:.1f} MB, "
+            f"latensi {trial['latency_ms']:.2f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pencarian hyperparameter model prakiraan (successive halving).")
+    parser.add_argument('--data', default=DATA_FILE, help="Path file CSV dataset.")
+    parser.add_argument('--brand', default=ALL_BRANDS, help="Tuning hanya untuk satu brand.")
+    parser.add_argument('--candidates', type=int, default=27, help="Jumlah kandidat awal per model.")
+    parser.add_argument('--eta', type=int, default=3, help="Faktor pengurangan kandidat per babak.")
+    parser.add_argument('--test-size', type=float, default=0.2, help="Porsi data holdout.")
+    parser.add_argument('--tolerance', type=float, default=0.01, help="Toleransi kenaikan error relatif terhadap konfigurasi bawaan.")
+    parser.add_argument('--size-weight', type=float, default=0.001, help="Bobot skor per MB ukuran model.")
+    parser.add_argument('--latency-weight', type=float, default=0.005, help="Bobot skor per ms latensi satu baris.")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Jumlah proses worker.")
+    parser.add_argument('--out', default=MODEL_CONFIG_FILE, help="File konfigurasi model yang ditulis.")
+    parser.add_argument('--dry-run', action='store_true', help="Tampilkan hasil tanpa menulis file konfigurasi.")
+    args = parser.parse_args(argv)
+
+    start = time.time()
+    shared = parallel.init_shared(load_shared, (args.data, args.brand, args.test_size))
+    n_train = len(shared['X_train'])
+    print(f"{n_train:,} baris latih, {shared['X_test'].shape[0]:,} baris holdout.")
+
+    config = {}
+    with parallel.make_pool(load_shared, (args.data, args.brand, args.test_size), args.workers) as pool:
+        for kind in ('regressor', 'classifier'):
+            candidates = sample_candidates(args.candidates, kind)
+            trials = successive_halving(pool, kind, candidates, n_train, args.eta,
+                                        args.size_weight, args.latency_weight)
+            best, baseline, error_bar = choose(kind, trials, args.tolerance, args.size_weight, args.latency_weight)
+            print(f"  [{kind}] bawaan : {_describe(baseline)}")
+            print(f"  [{kind}] terpilih: {json.dumps(best['params'])}")
+            print(f"  [{kind}]           {_describe(best)} (batas error {error_bar:.4f})")
+            config[kind] = best['params']
+
+    print(f"\nSelesai dalam {time.time() - start:.1f} detik.")
+    if args.dry_run:
+        print(json.dumps(config, indent=2))
+    else:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(config, f, indent=2)
+        print(f"Konfigurasi ditulis ke '{args.out}'. Model akan dilatih ulang dengan konfigurasi ini saat dibutuhkan.")
+
+
+if __name__ == "__main__":
+    main()
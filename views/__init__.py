@@ -0,0 +1,10 @@
+# --- Daftar Halaman ---
+# Setiap halaman adalah modul dengan fungsi render(ctx). Modul baru diimpor saat halaman
+# pertama kali dibuka, jadi dependensi berat (plotly, sklearn, dll.) tidak dimuat saat boot.
+PAGES = {
+    "Beranda": "views.beranda",
+    "Presentasi": "views.presentasi",
+    "Analisis Rangking": "views.rangking",
+    "Perbandingan": "views.perbandingan",
+    "Prakiraan": "views.prakiraan",
+}
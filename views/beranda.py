@@ -0,0 +1,41 @@
+"""
+Halaman Beranda: sambutan dan petunjuk menu.
+"""
+import streamlit as st
+
+
+def render(ctx):
+    
+    # --- PERMINTAAN #2: Ganti Lottie dengan Gambar Lokal ---
+    col_anim, col_text = st.columns([1, 2])
+    
+    with col_anim:
+        try:
+            # Coba muat gambar lokal 'beranda.png'
+            st.image(
+                "logo.png",
+                use_container_width=True, # <-- PERBAIKAN (Poin 3): dari use_column_width
+                caption="Visualisasi Analisis Data"
+            )
+        except FileNotFoundError:
+            # Fallback jika gambar tidak ditemukan
+            st.info("Letakkan file 'beranda.png' di folder yang sama dengan file .py ini untuk menampilkan gambar kustom di sini.")
+            # Anda bisa mengaktifkan Lottie lagi sebagai fallback jika mau
+            # lottie_animation = load_lottieurl("https://assets9.lottiefiles.com/packages/lf20_s9algjvi.json") 
+            # if lottie_animation:
+            #     st_lottie(lottie_animation, height=300, key="analytics_fallback")
+
+    
+    with col_text:
+        st.title("Selamat Datang di Dashboard Analisis Engagement 🚀")
+        st.markdown("""
+        Aplikasi ini membantu Anda memahami dan memprediksi engagement media sosial. 
+        Gunakan **AI** kami untuk mendapatkan prakiraan performa konten atau jelajahi 
+        data historis Anda untuk menemukan tren teratas.
+        
+        Pilih salah satu menu di **Sidebar** untuk memulai:
+        - **Presentasi:** Lihat penjelasan visual proyek ini.
+        - **Analisis Rangking:** Jelajahi performa konten historis.
+        - **Perbandingan:** Bandingkan campaign, brand, atau produk secara statistik.
+        - **Prakiraan:** Dapatkan prediksi AI untuk konten baru.
+        """)
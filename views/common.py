@@ -0,0 +1,155 @@
+import os
+
+import streamlit as st
+
+from datasets import list_brands, load_partition, model_slot
+from model_store import ModelStore
+from warmup import Warmup
+
+# --- Mode Pemanasan ---
+# 'data'   : saat boot hanya data & metrik yang dipanaskan; model (dan sklearn) baru dimuat
+#            saat halaman Prakiraan pertama kali dibuka.
+# 'models' : model ikut dipanaskan di latar belakang sejak sesi pertama.
+WARMUP_MODE = os.environ.get("ENGAGEMENT_WARMUP", "data")
+
+# Jumlah partisi (dataset x brand x versi isi) yang data & pemanasannya disimpan di memori;
+# partisi terlama dikeluarkan, termasuk versi lama file CSV yang sudah diekspor ulang
+PARTITION_CACHE_ENTRIES = int(os.environ.get("ENGAGEMENT_PARTITION_CACHE_ENTRIES", "8"))
+
+# --- Kamus Bahasa & Bendera ---
+LANG_MAP = {
+    'pt': 'Portuguese 🇵🇹',
+    'ru': 'Russian 🇷🇺',
+    'ar': 'Arabic 🇸🇦',
+    'ja': 'Japanese 🇯🇵',
+    'fr': 'French 🇫🇷',
+    'en': 'English 🇬🇧',
+    'es': 'Spanish 🇪🇸',
+    'de': 'German 🇩🇪',
+    'zh': 'Chinese 🇨🇳',
+    'hi': 'Hindi 🇮🇳',
+    'ko': 'Korean 🇰🇷',
+    'id': 'Indonesian 🇮🇩',
+    'it': 'Italian 🇮🇹'
+}
+REVERSE_LANG_MAP = {v: k for k, v in LANG_MAP.items()}
+
+# --- Label Fitur Model ---
+FEATURE_LABELS = {
+    'day_of_week': 'Hari',
+    'language': 'Bahasa',
+    'platform': 'Platform',
+    'keyword_model': 'Keyword',
+    'hashtag_model': 'Hashtag',
+    'campaign_name': 'Campaign'
+}
+
+
+# --- Cache Model per Partisi (LRU) ---
+@st.cache_resource
+def get_model_store():
+    """
+    Satu penyimpanan model (LRU + disk) untuk seluruh sesi di proses server ini.
+    """
+    return ModelStore()
+
+
+@st.cache_data(max_entries=PARTITION_CACHE_ENTRIES)
+def get_brands(path, key):
+    """
+    Daftar brand untuk pilihan partisi (`key` = hash isi file, agar cache ikut berganti).
+    """
+    return list_brands(path)
+
+
+# --- Pemanasan Cache di Latar Belakang ---
+@st.cache_resource(max_entries=PARTITION_CACHE_ENTRIES)
+def start_data_warmup(key, path, brand):
+    """
+    Memulai pemanasan data & metrik satu partisi di thread latar belakang
+    (sekali per partisi per proses server).
+    """
+    from analytics import get_advanced_metrics
+
+    return Warmup([
+        ('data', "data", lambda results: load_partition(path, brand)),
+        ('metrics', "metrik saran", lambda results: get_advanced_metrics(results['data'][0], results['data'][2])),
+    ]).start()
+
+
+@st.cache_resource(max_entries=PARTITION_CACHE_ENTRIES)
+def start_model_warmup(key, models_key, path, brand, config):
+    """
+    Memulai pelatihan/pemuatan model dan permutation importance satu partisi di thread
+    latar belakang (sekali per partisi & versi model per proses server). Modul sklearn
+    baru diimpor di sini, jadi proses yang tidak pernah membuka Prakiraan tidak memuatnya.
+    """
+    from analytics import build_model_artifact
+    from explain import ensure_importance
+
+    data_warmup = get_data_warmup(key, path, brand)
+    model_store = get_model_store()
+
+    def partition_df():
+        if not data_warmup.wait('data'):
+            raise RuntimeError(f"data partisi gagal dimuat: {data_warmup.error}")
+        return data_warmup.get('data')[0]
+
+    def warm_models(results):
+        # Model disimpan di ModelStore (bukan di hasil warmup) agar bisa dikeluarkan oleh LRU
+        df = partition_df()
+        model_store.get(models_key, lambda: build_model_artifact(df, config), slot=model_slot(path, brand))
+
+    def warm_importance(results):
+        # Permutation importance dihitung sekali per versi model dan disimpan bersama artefaknya
+        df = partition_df()
+        ensure_importance(model_store, models_key, lambda: build_model_artifact(df, config), df)
+
+    return Warmup([
+        ('models', "model AI", warm_models),
+        ('importance', "tingkat kepentingan fitur", warm_importance),
+    ]).start()
+
+
+def _restart_if_failed(start, *args):
+    """
+    Mengambil pemanasan dari cache; jika pemanasan itu gagal, entri cache-nya dibuang dan
+    pemanasan dimulai ulang, agar error sementara tidak menetap sampai proses server restart.
+    """
+    warmup = start(*args)
+    if warmup.errors:
+        start.clear(*args)
+        warmup = start(*args)
+    return warmup
+
+
+def get_data_warmup(key, path, brand):
+    return _restart_if_failed(start_data_warmup, key, path, brand)
+
+
+def get_model_warmup(key, models_key, path, brand, config):
+    return _restart_if_failed(start_model_warmup, key, models_key, path, brand, config)
+
+
+def wait_for_stages(warmup, *stages):
+    """
+    Menunggu tahap pemanasan yang dibutuhkan halaman sambil menampilkan indikator progres.
+    """
+    if not warmup.is_ready(*stages) and not warmup.done:
+        progress_bar = st.progress(warmup.progress, text="⏳ Menyiapkan data...")
+        while not warmup.wait(*stages, timeout=0.5) and not warmup.done:
+            progress_bar.progress(warmup.progress, text=f"⏳ Menyiapkan {warmup.current or 'data'}...")
+        progress_bar.empty()
+
+    if not warmup.is_ready(*stages):
+        error = warmup.errors.get('data')
+        if isinstance(error, FileNotFoundError):
+            st.error(f"File '{os.path.basename(error.filename or '')}' tidak ditemukan. Pastikan file tersebut ada di direktori yang sama.")
+        elif error is not None:
+            st.error(f"Terjadi kesalahan saat memuat data: {error}")
+        else:
+            st.error(f"Terjadi kesalahan saat menyiapkan {', '.join(warmup.errors)}: {warmup.error}")
+        st.error("Gagal memuat data. Aplikasi tidak dapat dijalankan.")
+        st.stop()
+
+    return warmup.get(*stages)
@@ -0,0 +1,79 @@
+"""
+Halaman Perbandingan: rata-rata antar kelompok dengan interval kepercayaan bootstrap.
+"""
+import plotly.express as px
+import streamlit as st
+
+from compare import compare_groups, BOOTSTRAP_RESAMPLES, COMPARE_METRICS
+from views.common import wait_for_stages
+
+
+# --- Fungsi Perbandingan (Bootstrap) ---
+@st.cache_data
+def get_comparison(key, _df, by, selected, n_resamples):
+    """
+    Perbandingan bootstrap yang di-cache per partisi (`key`) dan per pilihan pengguna.
+    """
+    return compare_groups(_df, by, list(selected), n_resamples=n_resamples)
+
+
+def render(ctx):
+    active_key = ctx['active_key']
+    st.title("⚖️ Perbandingan Campaign, Brand & Produk")
+    df, df_hashtags, df_keywords = wait_for_stages(ctx['data_warmup'], 'data')
+    st.markdown("Bandingkan rata-rata performa antar kelompok. Garis error menunjukkan **interval kepercayaan 95%** hasil *bootstrap*.")
+
+    compare_dimensions = {'Campaign': 'campaign_name', 'Brand': 'brand_name', 'Produk': 'product_name'}
+    metric_labels = {'engagement_rate': 'Engagement Rate', 'likes_count': 'Likes', 'shares_count': 'Shares'}
+
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        dimension = st.radio("Bandingkan berdasarkan:", list(compare_dimensions))
+        n_resamples = st.select_slider("Jumlah resample bootstrap:", options=[1000, 2000, 5000, 10000], value=BOOTSTRAP_RESAMPLES)
+    by = compare_dimensions[dimension]
+    # Default: 5 kelompok dengan postingan terbanyak
+    group_options = df[by].value_counts().index.tolist()
+    with col2:
+        selected_groups = st.multiselect(f"Pilih {dimension}:", sorted(group_options), default=group_options[:5])
+
+    if len(selected_groups) < 2:
+        st.warning(f"⚠️ Pilih minimal 2 {dimension} untuk dibandingkan.")
+    else:
+        with st.spinner("Menghitung interval kepercayaan bootstrap..."):
+            comparison = get_comparison(active_key, df, by, tuple(sorted(selected_groups)), n_resamples)
+
+        tabs = st.tabs([metric_labels[m] for m in COMPARE_METRICS])
+        for tab, metric in zip(tabs, COMPARE_METRICS):
+            with tab:
+                metric_df = comparison[comparison['metric'] == metric].sort_values('mean', ascending=False)
+                # Kelompok yang semua nilai metriknya kosong tidak ikut dibandingkan
+                if len(metric_df) < 2:
+                    st.warning(f"⚠️ Hanya {len(metric_df)} {dimension} yang memiliki data {metric_labels[metric]}. Pilih minimal 2 {dimension} untuk dibandingkan.")
+                    continue
+                fig = px.bar(metric_df,
+                             x='group', y='mean',
+                             error_y=metric_df['upper'] - metric_df['mean'],
+                             error_y_minus=metric_df['mean'] - metric_df['lower'],
+                             title=f"Rata-rata {metric_labels[metric]} per {dimension}",
+                             color='mean', color_continuous_scale='Viridis',
+                             labels={'group': dimension, 'mean': f"Rata-rata {metric_labels[metric]}"},
+                             hover_data={'n': True, 'lower': ':.4f', 'upper': ':.4f'})
+                if metric == 'engagement_rate':
+                    fig.update_layout(yaxis_tickformat='.1%')
+                st.plotly_chart(fig, use_container_width=True)
+
+                # KESIMPULAN: apakah pemimpin benar-benar unggul (interval tidak tumpang tindih)?
+                best, runner_up = metric_df.iloc[0], metric_df.iloc[1]
+                value_format = (lambda v: f"{v:.2%}") if metric == 'engagement_rate' else (lambda v: f"{v:,.0f}")
+                if best['lower'] > runner_up['upper']:
+                    verdict = (f"Interval kepercayaannya **tidak tumpang tindih** dengan **{runner_up['group']}**, "
+                               f"jadi keunggulan ini kemungkinan besar **nyata**.")
+                else:
+                    verdict = (f"Namun intervalnya **tumpang tindih** dengan **{runner_up['group']}** "
+                               f"({value_format(runner_up['lower'])} - {value_format(runner_up['upper'])}), "
+                               f"jadi selisihnya **belum tentu nyata**. Kumpulkan lebih banyak data sebelum mengambil keputusan.")
+                st.info(
+                    f"💡 **Analisis Singkat:** **{best['group']}** memiliki rata-rata {metric_labels[metric]} tertinggi "
+                    f"({value_format(best['mean'])}, interval {value_format(best['lower'])} - {value_format(best['upper'])}). {verdict}",
+                    icon="💡"
+                )
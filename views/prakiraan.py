@@ -0,0 +1,282 @@
+"""
+Halaman Prakiraan: prediksi model AI untuk konten baru beserta penjelasannya.
+"""
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from analytics import build_model_artifact, FEATURES, TARGETS_REG
+from datasets import model_slot
+from explain import get_explainer, IMPORTANCE_TEST_SIZE
+from views.common import (LANG_MAP, REVERSE_LANG_MAP, FEATURE_LABELS, get_model_store,
+                          get_model_warmup, wait_for_stages)
+
+
+def render(ctx):
+    active_model_key, model_config = ctx['active_model_key'], ctx['model_config']
+    st.title("🔮 Prakiraan Engagement Konten")
+    (df, df_hashtags, df_keywords), advanced_metrics = wait_for_stages(ctx['data_warmup'], 'data', 'metrics')
+    # Model partisi ini dipanaskan saat halaman ini pertama kali dibuka (kecuali mode 'models')
+    model_warmup = get_model_warmup(ctx['active_key'], active_model_key, ctx['dataset_path'], ctx['brand'], model_config)
+    wait_for_stages(model_warmup, 'models')
+
+    # Model partisi ini mungkin sudah dikeluarkan dari memori oleh LRU; muat ulang dari disk jika perlu
+    model_store = get_model_store()
+    with st.spinner("Memuat model dari disk..."):
+        models = model_store.get(active_model_key, lambda: build_model_artifact(df, model_config),
+                                 slot=model_slot(ctx['dataset_path'], ctx['brand']))
+    pipeline_reg = models['pipeline_reg']
+    pipeline_clf = models['pipeline_clf']
+    unique_values = models['unique_values']
+
+    # Metrik global sebagai fallback
+    avg_engagement = df['engagement_rate'].mean()
+    avg_toxicity = df['toxicity_score'].mean()
+    top_day = df['day_of_week'].value_counts().idxmax()
+    st.markdown("Masukkan detail konten yang akan Anda upload untuk mendapatkan prakiraan engagement.")
+
+    with st.form("prediction_form"):
+        st.subheader("Form Input Konten")
+        
+        # --- PERBAIKAN: Menambahkan 'placeholder_text' ---
+        placeholder_text = "Pilih Opsi..." 
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            # --- PERBAIKAN: Menambahkan placeholder dan index=0 ---
+            day_options = [placeholder_text] + sorted(unique_values['day_of_week'])
+            day = st.selectbox("Hari Upload:", day_options, index=0)
+            
+            lang_codes_from_data = sorted(unique_values['language'])
+            lang_display_options = [placeholder_text] + sorted([LANG_MAP.get(code, code) for code in lang_codes_from_data if code in LANG_MAP])
+            lang_display_selection = st.selectbox("Bahasa:", lang_display_options, index=0)
+            
+        with col2:
+            # --- PERBAIKAN: Menambahkan placeholder dan index=0 ---
+            platform_options = [placeholder_text] + sorted(unique_values['platform'])
+            platform = st.selectbox("Platform:", platform_options, index=0)
+            
+            campaign_options = [placeholder_text] + sorted(unique_values['campaign_name'])
+            campaign = st.selectbox("Campaign:", campaign_options, index=0)
+        with col3:
+            # --- PERBAIKAN: Menambahkan placeholder dan index=0 ---
+            keyword_options = [placeholder_text] + sorted([k for k in unique_values['keyword_model'] if pd.notna(k)])
+            keyword = st.selectbox("Keyword Utama:", keyword_options, index=0)
+            
+            hashtag_options = [placeholder_text] + sorted([h for h in unique_values['hashtag_model'] if pd.notna(h)])
+            hashtag = st.selectbox("Hashtag Utama:", hashtag_options, index=0)
+
+        submit_button = st.form_submit_button("Dapatkan Prakiraan 🚀", type="primary")
+
+    if submit_button:
+        # --- PERBAIKAN: Menambahkan blok validasi ---
+        if (day == placeholder_text or 
+            lang_display_selection == placeholder_text or 
+            platform == placeholder_text or 
+            campaign == placeholder_text or 
+            keyword == placeholder_text or 
+            hashtag == placeholder_text):
+            
+            st.warning("⚠️ Mohon lengkapi semua 6 pilihan untuk mendapatkan prakiraan.")
+        
+        else: 
+            # --- PERBAIKAN: Memastikan sisa kode di-indentasi (digeser ke kanan) di dalam 'else' ---
+            lang_code = REVERSE_LANG_MAP.get(lang_display_selection, lang_display_selection)
+            input_data = pd.DataFrame({
+                'day_of_week': [day],
+                'language': [lang_code], 
+                'platform': [platform],
+                'keyword_model': [keyword],
+                'hashtag_model': [hashtag],
+                'campaign_name': [campaign]
+            }) # <-- Ini adalah ')' yang hilang dari error Anda
+            
+            with st.spinner("Menganalisis & Memproses Prakiraan..."):
+                pred_reg = pipeline_reg.predict(input_data)[0]
+                pred_clf = pipeline_clf.predict(input_data)[0]
+                
+                results_reg = {
+                    'Likes': (pred_reg[0], "❤️"),
+                    'Shares': (pred_reg[1], "🔁"),
+                    'Comments': (pred_reg[2], "💬"),
+                    'Impressions': (pred_reg[4], "👁️"),
+                    'Toxicity Rate': (pred_reg[3], "☣️"),
+                    'Engagement Rate': (pred_reg[5], "🔥")
+                }
+                
+                emotion_emoji_map = {
+                    'Positive': '😄', 'Negative': '😠', 'Neutral': '😐',
+                    'Happy': '😊', 'Sad': '😢', 'Angry': '😠', 'Excited': '🤩',
+                    'Confused': '🤔', 'Surprised': '😲', 'Fear': '😨'
+                }
+                emotion_emoji = emotion_emoji_map.get(pred_clf, "❓")
+
+                st.subheader("🎉 Hasil Prakiraan:")
+                cols = st.columns(4)
+                cols[0].metric(label=f"Tipe Emosi", value=f"{emotion_emoji} {pred_clf}")
+                
+                i = 1 
+                for key, (value, emoji) in results_reg.items():
+                    col = cols[i % 4]
+                    if key in ['Toxicity Rate', 'Engagement Rate']:
+                        formatted_val = f"{value * 100:.2f}%"
+                        col.metric(label=f"{emoji} {key}", value=formatted_val)
+                    else:
+                        formatted_val = f"{int(value):,}"
+                        col.metric(label=f"{emoji} {key}", value=formatted_val)
+                    i += 1
+                
+                st.markdown("<hr>", unsafe_allow_html=True)
+                
+                # --- BAGIAN BARU: KESIMPULAN & SARAN (LOGIKA SANGAT DISEMPURNAKAN) ---
+                st.subheader("💡 Analisis & Saran (Tingkat Lanjut)")
+                
+                # Mendapatkan data prediksi
+                engagement_pred = pred_reg[5]
+                toxicity_pred = pred_reg[3]
+                impressions_pred = pred_reg[4]
+                shares_pred = pred_reg[1]
+                comments_pred = pred_reg[2]
+                suggestions = []
+
+                # --- Mendapatkan Metrik Kontekstual ---
+                platform_metrics_dict = advanced_metrics.get('platform', {})
+                platform_metrics = platform_metrics_dict.get(platform, {})
+                
+                avg_eng_platform = platform_metrics.get('avg_engagement', avg_engagement)
+                avg_tox_platform = platform_metrics.get('avg_toxicity', avg_toxicity)
+                top_day_platform = platform_metrics.get('top_day', top_day)
+
+                avg_eng_day_choice = advanced_metrics.get('day', {}).get((platform, day), 0)
+                avg_eng_top_day = advanced_metrics.get('day', {}).get((platform, top_day_platform), 0)
+                
+                avg_eng_keyword_choice = advanced_metrics.get('keyword', {}).get(keyword, 0)
+                
+                # --- (BARU) Analisis Tujuan Konten / Persona ---
+                if toxicity_pred > 0.6 and pred_clf in ['Angry', 'Negative']:
+                    suggestions.append(f"🎯 **Tujuan Teridentifikasi: Konten Provokatif/Risiko Tinggi.** "
+                                       f"Emosi '{pred_clf}' dan Toksisitas {toxicity_pred:.2%} sangat tinggi. Ini akan memicu reaksi, tapi mungkin negatif. Gunakan HANYA jika ini disengaja (misal: debat panas, kritik). Risiko *bad buzz* tinggi.")
+                elif engagement_pred > avg_eng_platform and shares_pred > (df['shares_count'].mean() * 1.2):
+                    suggestions.append(f"🎯 **Tujuan Teridentifikasi: Viralitas & Jangkauan.** "
+                                       f"Prediksi 'Shares' dan 'Engagement' Anda tinggi. Konten ini berpotensi besar untuk menjangkau audiens baru (viral). Sangat baik untuk kampanye *awareness*.")
+                elif engagement_pred > avg_eng_platform and comments_pred > (df['comments_count'].mean() * 1.2):
+                    suggestions.append(f"🎯 **Tujuan Teridentifikasi: Membangun Komunitas.** "
+                                       f"Prediksi 'Comments' tinggi menunjukkan konten ini memicu diskusi. Sangat baik untuk membangun komunitas dan mendapatkan *feedback* langsung dari audiens setia Anda.")
+                elif impressions_pred > (df['impressions'].mean() * 1.5) and engagement_pred < avg_eng_platform:
+                    suggestions.append(f"🎯 **Tujuan Teridentifikasi: Jangkauan Luas (Awareness).** "
+                                       f"**Peringatan:** Konten Anda diprediksi akan **dilihat** banyak orang (Impresi tinggi), tapi **tidak menarik** (Engagement rendah). Ini disebut 'Scroll-by'. **Saran:** Perbaiki *hook* visual atau *Call-to-Action* (CTA) Anda agar lebih memikat.")
+                else:
+                    suggestions.append(f"🎯 **Tujuan Teridentifikasi: Performa Standar/Brand-Building.** "
+                                       f"Konten ini diprediksi akan berjalan sesuai standar. Ini adalah konten 'aman' yang baik untuk menjaga konsistensi brand Anda.")
+
+
+                # --- Analisis Performa Engagement (Sudah ada, tetap relevan) ---
+                if engagement_pred > avg_eng_platform * 1.1:
+                    suggestions.append(f"📈 **Performa Unggul:** Prediksi engagement Anda ({engagement_pred:.2%}) **jauh di atas rata-rata** untuk **{platform}** (rata-rata: {avg_eng_platform:.2%}). Kombinasi Anda terlihat sangat kuat!")
+                elif engagement_pred < avg_eng_platform * 0.9:
+                    suggestions.append(f"📉 **Performa Kurang:** Prediksi engagement Anda ({engagement_pred:.2%}) **di bawah rata-rata** untuk **{platform}** (rata-rata: {avg_eng_platform:.2%}). Mari kita lihat mengapa:")
+                else:
+                    suggestions.append(f"📊 **Performa Rata-rata:** Prediksi engagement Anda ({engagement_pred:.2%}) **sesuai rata-rata** untuk **{platform}** (rata-rata: {avg_eng_platform:.2%}). Ada ruang untuk optimalisasi.")
+
+                # --- Analisis "Weakest Link" (Hari) (Sudah ada, tetap relevan) ---
+                if avg_eng_day_choice > 0 and avg_eng_top_day > 0 and avg_eng_day_choice < avg_eng_top_day:
+                    suggestions.append(
+                        f"  - **Peluang Hari:** Anda memilih **{day}**, yang di **{platform}** memiliki rata-rata engagement ({avg_eng_day_choice:.2%}). "
+                        f"Hari terkuat di **{platform}** adalah **{top_day_platform}** (rata-rata: {avg_eng_top_day:.2%}). "
+                        f"**Saran:** Jika topiknya fleksibel, pertimbangkan beralih ke **{top_day_platform}** untuk potensi peningkatan."
+                    )
+                
+                # --- Analisis Keyword (Sudah ada, tetap relevan) ---
+                if avg_eng_keyword_choice > 0 and avg_eng_keyword_choice > avg_engagement:
+                    suggestions.append(f"  - **Pilihan Keyword Baik:** Keyword Anda ('{keyword}') adalah pilihan kuat! Secara historis, keyword ini memiliki rata-rata engagement {avg_eng_keyword_choice:.2%}.")
+                elif avg_eng_keyword_choice > 0:
+                    suggestions.append(f"  - **Peringatan Keyword:** Keyword Anda ('{keyword}') secara historis memiliki engagement ({avg_eng_keyword_choice:.2%}) di bawah rata-rata global. Pastikan konten Anda sangat menonjol untuk mengatasi ini.")
+                
+                # --- Analisis Toksisitas & Emosi (Sintesis) (Sudah ada, tetap relevan) ---
+                if pred_clf in ['Negative', 'Angry', 'Sad', 'Fear'] and toxicity_pred < 0.6: # Filter out high-risk
+                    suggestions.append(
+                        f"  - **Analisis Emosi:** Anda mendapat prediksi emosi **{pred_clf}**. "
+                        f"Jika ini *sengaja* (misal: konten sedih/serius), ini wajar. "
+                        f"Jika *tidak disengaja*, emosi negatif ini bisa menjadi alasan utama prediksi engagement Anda (jika rendah). Pertimbangkan melembutkan bahasa/keyword."
+                    )
+                elif toxicity_pred > avg_tox_platform and toxicity_pred < 0.6: # Filter out high-risk
+                    suggestions.append(f"  - **Peringatan Toksisitas:** Emosi Anda **{pred_clf}** (positif/netral), tetapi toksisitas Anda ({toxicity_pred:.2%}) masih **di atas rata-rata** {platform} ({avg_tox_platform:.2%}). "
+                                       f"Ini mungkin karena keyword/hashtag ('{keyword}', '{hashtag}') yang bisa disalahartikan. Cek ulang.")
+                
+                # --- Golden Combo Insight (Sudah ada, tetap relevan) ---
+                if 'golden_combo' in advanced_metrics:
+                    g_plat, g_day, g_lang_code = advanced_metrics['golden_combo']
+                    g_lang_display = LANG_MAP.get(g_lang_code, g_lang_code)
+                    g_avg = advanced_metrics['golden_avg']
+                    suggestions.append(f"  - **Insight Tambahan:** Hanya sebagai info, 'kombinasi emas' di data Anda (engagement tertinggi) adalah: **{g_plat}** + **{g_day}** + **{g_lang_display}**, dengan rata-rata engagement {g_avg:.2%}.")
+                
+
+                # Tampilkan semua saran
+                if suggestions:
+                    st.info("Berdasarkan data historis Anda:", icon="ℹ️")
+                    for suggestion in suggestions:
+                        st.markdown(f"- {suggestion}")
+
+                st.markdown("<hr>", unsafe_allow_html=True)
+
+                # --- BAGIAN BARU: FAKTOR PENDORONG PREDIKSI ---
+                st.subheader("🔍 Faktor Pendorong Prediksi")
+                st.markdown("Seberapa besar tiap pilihan Anda menaikkan atau menurunkan prediksi dibandingkan rata-rata model.")
+
+                _, contrib_reg = get_explainer(pipeline_reg).explain(input_data)
+                _, contrib_clf = get_explainer(pipeline_clf).explain(input_data)
+                contrib_df = pd.DataFrame({
+                    'Fitur': [FEATURE_LABELS[f] for f in FEATURES],
+                    'Engagement Rate': contrib_reg[0, :, TARGETS_REG.index('engagement_rate')],
+                    'Peluang Emosi': contrib_clf[0, :, list(pipeline_clf.classes_).index(pred_clf)],
+                })
+
+                col_eng, col_emo = st.columns(2)
+                with col_eng:
+                    fig = px.bar(contrib_df.sort_values('Engagement Rate'),
+                                 x='Engagement Rate', y='Fitur', orientation='h',
+                                 title="Kontribusi terhadap Engagement Rate",
+                                 color='Engagement Rate', color_continuous_scale='RdBu')
+                    fig.update_layout(xaxis_tickformat='.2%', coloraxis_showscale=False)
+                    st.plotly_chart(fig, use_container_width=True)
+                with col_emo:
+                    fig = px.bar(contrib_df.sort_values('Peluang Emosi'),
+                                 x='Peluang Emosi', y='Fitur', orientation='h',
+                                 title=f"Kontribusi terhadap Peluang Emosi '{pred_clf}'",
+                                 color='Peluang Emosi', color_continuous_scale='RdBu')
+                    fig.update_layout(xaxis_tickformat='.1%', coloraxis_showscale=False)
+                    st.plotly_chart(fig, use_container_width=True)
+
+                top_driver = contrib_df.loc[contrib_df['Engagement Rate'].idxmax()]
+                weak_driver = contrib_df.loc[contrib_df['Engagement Rate'].idxmin()]
+                st.info(
+                    f"💡 **Analisis Singkat:** Pendorong terbesar engagement Anda adalah **{top_driver['Fitur']}** ({top_driver['Engagement Rate']:+.2%}), "
+                    f"sedangkan **{weak_driver['Fitur']}** paling menahan ({weak_driver['Engagement Rate']:+.2%}). "
+                    f"**Saran:** Jika ingin mengoptimalkan, mulailah dengan mengganti pilihan **{weak_driver['Fitur']}**.",
+                    icon="💡"
+                )
+
+                # Permutation importance global (dihitung di latar belakang, sekali per versi model)
+                importance = models.get('importance')
+                scores = models.get('importance_scores')
+                if importance and scores:
+                    with st.expander("📊 Fitur Paling Berpengaruh (Global)"):
+                        importance_df = pd.DataFrame({
+                            'Fitur': [FEATURE_LABELS[f] for f in FEATURES],
+                            'Engagement Rate (penurunan R²)': [importance['engagement_rate'][f][0] for f in FEATURES],
+                            'Emosi (penurunan akurasi)': [importance['emotion_type'][f][0] for f in FEATURES],
+                        }).melt(id_vars='Fitur', var_name='Model', value_name='Kepentingan')
+                        fig = px.bar(importance_df, x='Fitur', y='Kepentingan', color='Model', barmode='group',
+                                     title="Permutation Importance: Penurunan Skor Saat Fitur Diacak")
+                        st.plotly_chart(fig, use_container_width=True)
+                        st.caption("Semakin besar penurunan skor saat sebuah fitur diacak, semakin besar ketergantungan model pada fitur tersebut.")
+                        st.caption(f"Dihitung pada {IMPORTANCE_TEST_SIZE:.0%} data *holdout* yang tidak dipakai melatih model. "
+                                   f"Skor holdout tanpa pengacakan: R² engagement rate {scores['engagement_rate']:.3f}, "
+                                   f"akurasi emosi {scores['emotion_type']:.1%}.")
+                        if scores['engagement_rate'] <= 0:
+                            st.warning("⚠️ Model belum lebih baik daripada menebak rata-rata pada data baru (R² ≤ 0), "
+                                       "jadi angka kepentingan di atas belum bisa dijadikan pegangan.")
+                else:
+                    st.caption("⏳ Tingkat kepentingan fitur global masih dihitung di latar belakang.")
+
+                st.info("ℹ️ **Disclaimer:** Prakiraan dan saran ini dibuat berdasarkan model Machine Learning dari data historis pada website Kaggle. Hasil data ini dibuat pada tahun 2025.")
@@ -0,0 +1,199 @@
+"""
+Halaman Presentasi: penjelasan visual proyek dan dataset.
+"""
+import plotly.express as px
+import requests
+import streamlit as st
+from streamlit_lottie import st_lottie
+
+from datasets import ALL_BRANDS
+from views.common import wait_for_stages
+
+
+# --- Fungsi Lottie ---
+@st.cache_data
+def load_lottieurl(url: str):
+    """
+    Mengambil file JSON Lottie dari URL.
+    """
+    r = requests.get(url)
+    if r.status_code != 200:
+        return None
+    return r.json()
+
+# LOTTIE BARU untuk Halaman Presentasi
+LOTTIE_PRESENTATION_URL = "https://assets3.lottiefiles.com/packages/lf20_96bovlqg.json"
+
+# URL Gambar Placeholder (untuk contoh di halaman presentasi)
+PLACEHOLDER_IMG_URL = "https://placehold.co/600x300/6a11cb/white?text=Contoh+Gambar+Anda&font=lato"
+
+
+def render(ctx):
+    dataset_name, brand = ctx['dataset_name'], ctx['brand']
+    st.title("💡 Presentasi Proyek: Analisis Engagement")
+    df, df_hashtags, df_keywords = wait_for_stages(ctx['data_warmup'], 'data')
+    
+    # --- PERBAIKAN: Menghapus st.columns ---
+    # Animasi Lottie sekarang akan menjadi full-width
+    lottie_pres = load_lottieurl(LOTTIE_PRESENTATION_URL)
+    if lottie_pres:
+        st_lottie(lottie_pres, height=300)
+    
+    # Kartu "Selamat Datang" sekarang akan menjadi full-width
+    st.markdown("""
+    <div class="presentation-card" style="text-align: center;"> <!-- PERBAIKAN (Poin 1): text-align: center -->
+    <h3>Selamat datang di presentasi proyek ini.</h3>
+    Aplikasi ini dirancang sebagai <span class="highlight-text">Alat Bantu Pengambilan Keputusan (Decision Support Tool)</span> untuk strategi konten media sosial Anda.
+    <br><br>
+    <strong>Tujuannya adalah mengubah data mentah menjadi wawasan yang dapat ditindaklanjuti.</strong>
+    </div>
+    """, unsafe_allow_html=True)
+    # --- AKHIR PERBAIKAN ---
+    
+    st.markdown("<hr>", unsafe_allow_html=True)
+    
+    # --- PERBAIKAN (Poin 2): Penjelasan Dataset Lebih Rinci ---
+    st.subheader("1. Dataset: Bahan Bakar Kita")
+    st.markdown(f"Aplikasi ini ditenagai oleh dataset `{dataset_name}`" + (f" (brand **{brand}**)" if brand != ALL_BRANDS else "") + ". Mari kita bedah data ini:")
+    
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Total Postingan", f"{len(df):,}")
+    c2.metric("Platform Teratas", df['platform'].mode()[0])
+    c3.metric("Total Bahasa", df['language'].nunique())
+    c4.metric("Hari Teraktif", df['day_of_week'].mode()[0])
+    
+    st.markdown("**Pratinjau Data Mentah:**")
+    st.dataframe(df.head())
+
+    # PERBAIKAN (Poin 2): Penjelasan kolom yang lebih rinci
+    st.markdown("**Penjelasan Lengkap Seluruh Kolom Dataset:**")
+    
+    # Buat daftar deskripsi kolom
+    column_descriptions = {
+        "day_of_week": "Hari (Senin, Selasa, dll.) saat konten diposting.",
+        "platform": "Platform media sosial (Instagram, Twitter, dll.) tempat konten diposting.",
+        "location": "Lokasi geografis (biasanya kota/negara) yang terkait dengan postingan.",
+        "language": "Kode bahasa (pt, ru, en, dll.) dari teks konten.",
+        "text_content": "Teks mentah aktual dari postingan tersebut.",
+        "hashtags": "Daftar hashtag (dipisahkan koma) yang digunakan dalam postingan.",
+        "keywords": "Daftar keyword (dipisahkan koma) yang diekstrak dari teks.",
+        "topic_category": "Kategori topik yang dibahas (Produk, Harga, dll.).",
+        "sentiment_score": "Skor numerik sentimen (-1 Negatif hingga +1 Positif).",
+        "sentiment_label": "Label sentimen (Positif, Negatif, Netral).",
+        "emotion_type": "Emosi spesifik yang terdeteksi (Senang, Marah, Bingung, dll.).",
+        "toxicity_score": "Skor numerik (0-1) yang menunjukkan seberapa toksik/negatif konten tersebut.",
+        "likes_count": "Jumlah 'Likes' yang diterima postingan.",
+        "shares_count": "Jumlah 'Shares' yang diterima postingan.",
+        "comments_count": "Jumlah 'Comments' yang diterima postingan.",
+        "impressions": "Jumlah total berapa kali postingan ditampilkan kepada pengguna.",
+        "engagement_rate": "Metrik kunci (biasanya (Likes+Comments+Shares)/Impressions) dalam format desimal (0-1).",
+        "brand_name": "Nama brand (Google, Nike, dll.) yang terkait dengan postingan.",
+        "product_name": "Nama produk spesifik (Chromebook, Epic React, dll.) yang disebutkan.",
+        "campaign_name": "Nama kampanye pemasaran (BlackFriday, PowerRelease, dll.) yang terkait."
+    }
+
+    # Tampilkan dalam dua kolom agar lebih rapi
+    col1_desc, col2_desc = st.columns(2)
+    
+    # Membagi daftar kolom
+    all_columns = list(column_descriptions.items())
+    mid_point = len(all_columns) // 2 + (len(all_columns) % 2)
+    
+    with col1_desc:
+        for col, desc in all_columns[:mid_point]:
+            st.markdown(f"- **{col}**: {desc}")
+
+    with col2_desc:
+        for col, desc in all_columns[mid_point:]:
+            st.markdown(f"- **{col}**: {desc}")
+    
+    st.markdown("**Ringkasan Statistik Data Numerik:**")
+    st.dataframe(df.describe())
+    
+    st.markdown("**Distribusi Platform:**")
+    platform_dist = df['platform'].value_counts().reset_index()
+    platform_dist.columns = ['Platform', 'Jumlah Postingan']
+    fig_pie = px.pie(platform_dist, 
+                     names='Platform', 
+                     values='Jumlah Postingan', 
+                     title='Distribusi Postingan di Seluruh Platform',
+                     hole=0.3)
+    fig_pie.update_traces(textposition='inside', textinfo='percent+label')
+    st.plotly_chart(fig_pie, use_container_width=True)
+
+    st.markdown("<hr>", unsafe_allow_html=True)
+
+    # --- PERMINTAAN #3: Penjelasan Misi Lebih Rinci ---
+    st.subheader("2. Misi & Tujuan")
+    st.markdown("Berdasarkan permintaan awal Anda, misi aplikasi ini terbagi menjadi dua tujuan utama:")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("""
+        <div class="presentation-card" style="background-color: rgba(37, 117, 252, 0.1);">
+        <h4>Menganalisa Data Historis (Melihat ke Belakang)</h4>
+        <p><strong>Permintaan:</strong> "Saya ingin menganalisa... rangking... top three day... top engagement... top likes... top language... top hashtag... top keyword."</p>
+        <p><strong>Tujuan:</strong> Kita perlu memahami apa yang <strong class="highlight-text">telah berhasil</strong> di masa lalu. Pola apa yang muncul? Platform, hari, atau keyword mana yang paling menguntungkan? Ini adalah dasar dari semua strategi.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    with col2:
+        st.markdown("""
+        <div class="presentation-card" style="background-color: rgba(106, 27, 203, 0.1);">
+        <h4>Memprediksi Performa Masa Depan (Melihat ke Depan)</h4>
+        <p><strong>Permintaan:</strong> "Saya ingin... Prakiraan... prediksi engagement dibuat berdasarkan: Hari, Bahasa, Platform, Keyword, Hashtag, dan Campaign."</p>
+        <p><strong>Tujuan:</strong> Menganalisa saja tidak cukup. Kita perlu menggunakan data historis untuk <strong class="highlight-text">melatih model AI (Machine Learning)</strong> yang dapat memprediksi performa konten yang <strong>belum ada</strong>.</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+    st.markdown("<hr>", unsafe_allow_html=True)
+    
+    # --- PERMINTAAN #3: Penjelasan Hasil (Menu) Lebih Rinci ---
+    st.subheader("3. Hasil Akhir: Penjelasan Fitur Aplikasi")
+    st.markdown("Untuk memenuhi kedua misi tersebut, aplikasi ini dibagi menjadi beberapa menu fungsional:")
+
+    st.markdown("""
+    <div class="presentation-card">
+    <h4>Beranda</h4>
+    <p>Halaman ini adalah pintu gerbang utama Anda. Ini memberikan sambutan dan navigasi visual ke fitur-fitur utama aplikasi, serta menampilkan visual utama (gambar yang Anda letakkan).</p>
+    </div>
+    
+    <div class="presentation-card">
+    <h4>Analisis Rangking</h4>
+    <p>Ini adalah jawaban untuk misi 'Menganalisa'. Halaman ini berisi 6 tab terpisah, masing-masing dengan <strong>visualisasi diagram batang</strong> untuk:
+    <ul>
+        <li>Hari Upload Terpopuler</li>
+        <li>Top 10 Postingan (Engagement Rate)</li>
+        <li>Top 10 Postingan (Likes)</li>
+        <li>Bahasa Paling Sering Digunakan</li>
+        <li>Top 10 Hashtag</li>
+        <li>Top 10 Keyword</li>
+    </ul>
+    Setiap diagram dilengkapi dengan <strong>kesimpulan dan saran</strong> otomatis berdasarkan data yang ditampilkan.
+    </p>
+    </div>
+    
+    <div class="presentation-card">
+    <h4>Perbandingan</h4>
+    <p>Halaman ini membandingkan rata-rata Engagement Rate, Likes, dan Shares antar <strong>Campaign</strong>, <strong>Brand</strong>, atau <strong>Produk</strong> pilihan Anda. Setiap rata-rata dilengkapi <strong>interval kepercayaan 95% (bootstrap)</strong>, sehingga Anda bisa melihat apakah selisihnya nyata atau hanya kebetulan.</p>
+    </div>
+    
+    <div class="presentation-card">
+    <h4>Prakiraan</h4>
+    <p>Ini adalah jawaban untuk misi 'Memprediksi'. Halaman ini adalah alat AI interaktif Anda:
+    <ol>
+        <li>Anda memasukkan 6 parameter konten baru (Hari, Bahasa, Platform, dll.).</li>
+        <li>Model AI <i>(Random Forest)</i> akan memprediksi 7 metrik performa secara instan (Likes, Shares, Comments, Engagement Rate, dll.).</li>
+        <li>Sistem kemudian memberikan <strong>Analisis & Saran Tingkat Lanjut</strong> yang membandingkan prediksi Anda dengan data historis, mengidentifikasi tujuan konten, dan mencari "titik terlemah" untuk dioptimalkan.</li>
+        <li>Bagian <strong>Faktor Pendorong Prediksi</strong> menunjukkan seberapa besar tiap pilihan Anda menaikkan atau menurunkan prediksi, beserta fitur yang paling berpengaruh secara global.</li>
+    </ol>
+    </p>
+    </div>
+    
+    <div class="presentation-card">
+    <h4>Presentasi</h4>
+    <p>Halaman yang sedang Anda lihat sekarang. Ini berfungsi sebagai dokumentasi dan penjelasan proyek secara keseluruhan, mulai dari dataset, tujuan, hingga hasil akhir.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+
+    st.markdown("<hr>", unsafe_allow_html=True)
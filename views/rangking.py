@@ -0,0 +1,226 @@
+"""
+Halaman Analisis Rangking: rangking performa konten historis.
+"""
+import plotly.express as px
+import streamlit as st
+
+from cooccurrence import build_cooccurrence, top_pairs, LIFT_MEASURES, MIN_PAIR_SUPPORT, TOP_K
+from views.common import LANG_MAP, wait_for_stages
+
+
+# --- Fungsi Kombinasi Tag (Co-occurrence) ---
+@st.cache_data
+def get_cooccurrence(key, _df, _df_exploded, column):
+    """
+    Matriks co-occurrence tag yang di-cache per versi dataset/partisi (`key`) dan per kolom.
+    """
+    return build_cooccurrence(_df, _df_exploded, column)
+
+
+def render(ctx):
+    st.title("🏆 Analisis Rangking Engagement")
+    df, df_hashtags, df_keywords = wait_for_stages(ctx['data_warmup'], 'data')
+    st.markdown("Berikut adalah rangking teratas berdasarkan data Anda. Semuanya dalam format diagram batang **vertikal** untuk perbandingan visual.")
+
+    # --- PERBAIKAN: Menghapus emoji dari nama tab untuk menghindari SyntaxError ---
+    tab_names = [
+        "Hari Upload", 
+        "Top 10 Engagement Rate", 
+        "Top 10 Likes",
+        "Bahasa", 
+        "Top 10 Hashtag", 
+        "Top 10 Keyword",
+        "Kombinasi Tag"
+    ]
+    tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs(tab_names)
+
+    # SEMUA TAB MENGGUNAKAN DIAGRAM BATANG VERTIKAL
+    with tab1: # Hari Upload
+        st.subheader("Popularitas Hari untuk Upload")
+        day_counts = df['day_of_week'].value_counts().reset_index()
+        day_counts.columns = ['Hari', 'Jumlah Post']
+        day_counts = day_counts.sort_values(by="Jumlah Post", ascending=False)
+        fig = px.bar(day_counts, 
+                     x='Hari', y='Jumlah Post',  # <-- Vertikal
+                     title="Jumlah Postingan Berdasarkan Hari",
+                     color='Jumlah Post', text_auto=True,
+                     color_continuous_scale='Viridis', # <-- PERMINTAAN #1
+                     labels={'Hari': 'Hari dalam Seminggu', 'Jumlah Post': 'Jumlah Postingan'})
+        fig.update_layout(showlegend=False)
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # KESIMPULAN (DISEMPURNAKAN)
+        if not day_counts.empty:
+            top_day_data = day_counts.iloc[0]
+            bottom_day = day_counts.iloc[-1]['Hari']
+            st.info(
+                f"💡 **Analisis Singkat:** Hari **{top_day_data['Hari']}** adalah hari tersibuk ({top_day_data['Jumlah Post']} postingan). "
+                f"Ini berarti audiens Anda paling aktif, TAPI juga **persaingan tertinggi**. "
+                f"**Saran:** Jika performa Anda rendah di hari ini, coba posting di hari yang lebih 'tenang' (seperti **{bottom_day}**) untuk melihat apakah konten Anda lebih menonjol.",
+                icon="💡"
+            )
+
+    with tab2: # Top 10 Engagement Rate
+        st.subheader("Top 10 Postingan dengan Engagement Rate Tertinggi")
+        top_eng = df.nlargest(10, 'engagement_rate')[['text_content', 'engagement_rate', 'platform']]
+        top_eng['text_display'] = top_eng['text_content'].str.slice(0, 60) + '...'
+        top_eng = top_eng.sort_values(by="engagement_rate", ascending=False) # Descending untuk vertikal
+        fig = px.bar(top_eng,
+                     x='text_display', y='engagement_rate',  # <-- Vertikal
+                     title="Top 10 Postingan: Engagement Rate",
+                     color='engagement_rate', color_continuous_scale='Plotly3', # <-- PERMINTAAN #1
+                     labels={'engagement_rate': 'Engagement Rate', 'text_display': 'Judul Konten'},
+                     hover_data={'text_content': True, 'platform': True, 'engagement_rate': ':.2%'} 
+                     )
+        fig.update_layout(yaxis_tickformat='.1%') 
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # KESIMPULAN (DISEMPURNAKAN)
+        if not top_eng.empty:
+            top_eng_post_data = top_eng.iloc[0] 
+            st.info(
+                f"💡 **Analisis Singkat:** Postingan di **{top_eng_post_data['platform']}** dengan rate **{top_eng_post_data['engagement_rate']:.2%}** adalah *benchmark* (standar emas) Anda. "
+                f"**Saran:** Pelajari **format**, **nada bicara (tone)**, dan **topik** dari postingan ini ({top_eng_post_data['text_content'][:40]}...). Apakah itu video? Pertanyaan? Gunakan ini sebagai template untuk konten berkinerja tinggi.",
+                icon="💡"
+            )
+
+    with tab3: # Top 10 Likes
+        st.subheader("Top 10 Postingan dengan Likes Terbanyak")
+        top_likes = df.nlargest(10, 'likes_count')[['text_content', 'likes_count', 'platform']]
+        top_likes['text_display'] = top_likes['text_content'].str.slice(0, 60) + '...'
+        top_likes = top_likes.sort_values(by="likes_count", ascending=False) # Descending untuk vertikal
+        fig = px.bar(top_likes,
+                     x='text_display', y='likes_count',  # <-- Vertikal
+                     title="Top 10 Postingan: Likes",
+                     color='likes_count', text_auto=True, color_continuous_scale='OrRd', # <-- PERMINTAAN #1
+                     labels={'likes_count': 'Jumlah Likes', 'text_display': 'Judul Konten'},
+                     hover_data={'text_content': True, 'platform': True}
+                     )
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # KESIMPULAN (DISEMPURNAKAN)
+        if not top_likes.empty:
+            top_like_post_data = top_likes.iloc[0]
+            st.info(
+                f"💡 **Analisis Singkat:** Postingan di **{top_like_post_data['platform']}** ({int(top_like_post_data['likes_count']):,} likes) adalah 'juara viralitas' Anda. "
+                f"**Saran:** Konten seperti ini sangat bagus untuk **Brand Awareness**. Gunakan format ({top_like_post_data['text_content'][:40]}...) untuk kampanye yang bertujuan menjangkau audiens baru yang belum mengenal Anda.",
+                icon="💡"
+            )
+
+    with tab4: # Bahasa
+        st.subheader("Popularitas Bahasa yang Digunakan")
+        lang_counts = df['language'].value_counts().reset_index()
+        lang_counts.columns = ['Bahasa', 'Jumlah']
+        lang_counts['Bahasa_Display'] = lang_counts['Bahasa'].map(LANG_MAP).fillna(lang_counts['Bahasa'])
+        lang_counts = lang_counts.sort_values(by="Jumlah", ascending=False) # Descending untuk vertikal
+        fig = px.bar(lang_counts, 
+                     x='Bahasa_Display', y='Jumlah',  # <-- Vertikal
+                     title="Jumlah Postingan Berdasarkan Bahasa",
+                     color='Jumlah', text_auto=True,
+                     color_continuous_scale='Plasma') # <-- PERMINTAAN #1
+        fig.update_layout(xaxis_title="Bahasa")
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # KESIMPULAN (DISEMPURNAKAN)
+        if not lang_counts.empty:
+            top_lang_data = lang_counts.iloc[0]
+            second_lang = lang_counts.iloc[1]['Bahasa_Display']
+            st.info(
+                f"💡 **Analisis Singkat:** Bahasa **{top_lang_data['Bahasa_Display']}** adalah audiens utama Anda ({top_lang_data['Jumlah']} postingan). "
+                f"**Saran:** Pertimbangkan untuk membuat konten spesifik atau menerjemahkan konten unggulan ke dalam bahasa kedua terpopuler Anda (**{second_lang}**) untuk memperluas jangkauan ke segmen baru.",
+                icon="💡"
+            )
+
+    with tab5: # Top 10 Hashtag
+        st.subheader("Top 10 Hashtag Paling Populer")
+        hash_counts = df_hashtags['hashtag'].value_counts().nlargest(10).reset_index()
+        hash_counts.columns = ['Hashtag', 'Jumlah']
+        hash_counts = hash_counts.dropna(subset=['Hashtag']) 
+        hash_counts = hash_counts.sort_values('Jumlah', ascending=False) # Descending untuk vertikal
+        fig = px.bar(hash_counts, 
+                     x='Hashtag', y='Jumlah',  # <-- Vertikal
+                     title="Top 10 Hashtag",
+                     color='Jumlah', text_auto=True,
+                     color_continuous_scale='Turbo') # <-- PERMINTAAN #1
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # KESIMPULAN (DISEMPURNAKAN)
+        if not hash_counts.empty:
+            top_hash_data = hash_counts.iloc[0]
+            second_hash = hash_counts.iloc[1]['Hashtag']
+            st.info(
+                f"💡 **Analisis Singkat:** Hashtag **#{top_hash_data['Hashtag']}** adalah tema sentral Anda ({top_hash_data['Jumlah']} kali). "
+                f"**Saran:** Untuk menghindari kejenuhan, kombinasikan hashtag utama ini dengan hashtag *niche* atau *trending* (seperti **#{second_hash}**) untuk menjangkau audiens yang lebih spesifik namun tetap relevan.",
+                icon="💡"
+            )
+
+    with tab6: # Top 10 Keyword
+        st.subheader("Top 10 Keyword Paling Populer")
+        key_counts = df_keywords['keyword'].value_counts().nlargest(10).reset_index()
+        key_counts.columns = ['Keyword', 'Jumlah']
+        key_counts = key_counts.dropna(subset=['Keyword']) 
+        key_counts = key_counts.sort_values('Jumlah', ascending=False) # Descending untuk vertikal
+        fig = px.bar(key_counts, 
+                     x='Keyword', y='Jumlah',  # <-- Vertikal
+                     title="Top 10 Keyword",
+                     color='Jumlah', text_auto=True,
+                     color_continuous_scale='Electric') # <-- PERMINTAAN #1
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # KESIMPULAN (DISEMPURNAKAN)
+        if not key_counts.empty:
+            top_key_data = key_counts.iloc[0]
+            st.info(
+                f"💡 **Analisis Singkat:** Keyword **'{top_key_data['Keyword']}'** adalah fokus utama dari strategi konten Anda ({top_key_data['Jumlah']} kali). "
+                f"**Saran:** Gunakan halaman 'Prakiraan' untuk menguji keyword ini di platform yang berbeda. Sangat mungkin keyword ini sangat laku di **Instagram**, tetapi kinerjanya biasa saja di **Twitter** (atau sebaliknya).",
+                icon="💡"
+            )
+
+    with tab7: # Kombinasi Tag
+        st.subheader("Kombinasi Hashtag & Keyword Terbaik")
+        st.markdown("Tag mana yang sering muncul bersama, dan pasangan mana yang engagement-nya **mengungguli** masing-masing tag jika dipakai sendiri.")
+        measure_labels = {'engagement_lift': 'Lift Engagement', 'lift': 'Lift Kemunculan'}
+        sources = {'Hashtag': (df_hashtags, 'hashtag'), 'Keyword': (df_keywords, 'keyword')}
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            source = st.radio("Jenis tag:", list(sources), horizontal=True)
+            measure = st.radio("Urutkan berdasarkan:", LIFT_MEASURES[::-1], format_func=measure_labels.get, horizontal=True)
+        df_exploded, column = sources[source]
+        cooc = get_cooccurrence(ctx['active_key'], df, df_exploded, column)
+        with col2:
+            focus = st.selectbox(f"Fokus pada {source.lower()}:", ["(Semua)"] + sorted(cooc['tags']))
+        with col3:
+            min_support = st.number_input("Minimal jumlah postingan bersama:", min_value=1, value=MIN_PAIR_SUPPORT)
+
+        pairs = top_pairs(cooc, k=TOP_K, by=measure, min_support=min_support,
+                          tag=None if focus == "(Semua)" else focus)
+        if pairs.empty:
+            st.warning("⚠️ Tidak ada pasangan yang memenuhi batas minimal jumlah postingan.")
+        else:
+            pairs['Pasangan'] = pairs['tag_a'] + " + " + pairs['tag_b']
+            fig = px.bar(pairs,
+                         x='Pasangan', y=measure,
+                         title=f"Top {TOP_K} Pasangan {source} berdasarkan {measure_labels[measure]}",
+                         color=measure, text_auto='.2f',
+                         color_continuous_scale='Plasma',
+                         labels={measure: measure_labels[measure]},
+                         hover_data={'posts': True, 'pair_mean': ':.2%', 'mean_a': ':.2%', 'mean_b': ':.2%'})
+            fig.add_hline(y=1, line_dash="dash", line_color="gray")
+            st.plotly_chart(fig, use_container_width=True)
+            st.caption("**Lift Engagement** = rata-rata engagement pasangan ÷ rata-rata terbaik dari kedua tag jika sendiri. "
+                       "**Lift Kemunculan** = seberapa sering keduanya muncul bersama dibanding jika kemunculannya acak. Nilai > 1 berarti di atas ekspektasi.")
+
+            # KESIMPULAN
+            best_pair = pairs.iloc[0]
+            if best_pair['engagement_lift'] > 1:
+                verdict = (f"**Saran:** Pasangan ini rata-rata menghasilkan engagement {best_pair['pair_mean']:.2%}, "
+                           f"lebih tinggi dari **{best_pair['tag_a']}** ({best_pair['mean_a']:.2%}) maupun **{best_pair['tag_b']}** ({best_pair['mean_b']:.2%}) jika dipakai sendiri. Coba gunakan keduanya bersamaan.")
+            else:
+                verdict = (f"**Saran:** Pasangan ini sering muncul bersama, tetapi engagement-nya ({best_pair['pair_mean']:.2%}) "
+                           f"belum mengungguli tag terbaiknya jika dipakai sendiri.")
+            st.info(
+                f"💡 **Analisis Singkat:** Pasangan teratas adalah **{best_pair['tag_a']}** + **{best_pair['tag_b']}** "
+                f"({best_pair['posts']} postingan, {measure_labels[measure]} {best_pair[measure]:.2f}). {verdict}",
+                icon="💡"
+            )
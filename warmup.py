@@ -0,0 +1,92 @@
+import threading
+import time
+
+
+class Warmup:
+    """
+    Menjalankan tahap-tahap pemanasan cache (data, metrik, model) di thread latar belakang.
+
+    Setiap tahap adalah tuple (nama, label, fungsi). Fungsi menerima dict hasil
+    tahap-tahap sebelumnya dan mengembalikan hasil tahap tersebut.
+    """
+
+    def __init__(self, stages):
+        self.stages = list(stages)
+        self.results = {}
+        self.errors = {}
+        self.current = None
+        self.finished_at = None
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def start(self):
+        """
+        Memulai worker latar belakang (hanya sekali).
+        """
+        with self._cond:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="cache-warmup", daemon=True)
+                self._thread.start()
+        return self
+
+    def _run(self):
+        for name, label, func in self.stages:
+            with self._cond:
+                self.current = label
+            try:
+                result = func(self.results)
+            except Exception as e:
+                # Tahap gagal: catat error dan hentikan tahap berikutnya
+                with self._cond:
+                    self.errors[name] = e
+                    self.current = None
+                    self.finished_at = time.time()
+                    self._cond.notify_all()
+                return
+            with self._cond:
+                self.results[name] = result
+                self._cond.notify_all()
+        with self._cond:
+            self.current = None
+            self.finished_at = time.time()
+            self._cond.notify_all()
+
+    @property
+    def progress(self):
+        """
+        Porsi tahap yang sudah selesai (0.0 - 1.0).
+        """
+        if not self.stages:
+            return 1.0
+        return len(self.results) / len(self.stages)
+
+    @property
+    def done(self):
+        return self.finished_at is not None
+
+    @property
+    def error(self):
+        """
+        Error pertama yang terjadi, atau None.
+        """
+        return next(iter(self.errors.values()), None)
+
+    def is_ready(self, *names):
+        return all(name in self.results for name in names)
+
+    def wait(self, *names, timeout=None):
+        """
+        Menunggu sampai tahap-tahap `names` selesai, gagal, atau `timeout` habis.
+        Mengembalikan True jika semua tahap sudah siap.
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: self.is_ready(*names) or self.done, timeout=timeout)
+            return self.is_ready(*names)
+
+    def get(self, *names):
+        """
+        Mengambil hasil tahap (tanpa menunggu).
+        """
+        if len(names) == 1:
+            return self.results[names[0]]
+        return tuple(self.results[name] for name in names)